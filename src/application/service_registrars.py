@@ -3,6 +3,7 @@ Service registrars for cleaner dependency injection setup
 Following DIP principle by providing different configurations
 """
 
+import dataclasses
 from abc import ABC, abstractmethod
 from typing import Protocol
 
@@ -230,9 +231,12 @@ class DevServicesRegistrar:
     ) -> None:
         """Register development services"""
         # Use core services but with development config overrides
-        dev_config = config
-        dev_config.logging.level = "DEBUG"
-        dev_config.logging.console_output = True
+        dev_config = dataclasses.replace(
+            config,
+            logging=dataclasses.replace(
+                config.logging, level="DEBUG", console_output=True
+            ),
+        )
 
         # Register core services
         core_registrar = CoreServicesRegistrar()
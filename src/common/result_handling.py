@@ -3,6 +3,8 @@ Consistent error handling strategy with async support and enhanced error context
 """
 
 import asyncio
+import copy
+import functools
 import time
 import traceback
 from abc import ABC, abstractmethod
@@ -15,12 +17,43 @@ T = TypeVar("T")
 E = TypeVar("E")
 R = TypeVar("R")
 
+# Value types that to_dict can pass through unchanged
+_SERIALIZABLE_TYPES = (str, int, float, bool, list, dict, type(None))
+
 
 class ResultStatus(Enum):
     SUCCESS = "success"
     FAILURE = "failure"
 
 
+def _copy_exception(exc: BaseException) -> BaseException:
+    """Shallow-copy one exception, dropping its traceback and implicit context"""
+    try:
+        new_exc = copy.copy(exc)
+    except Exception:
+        # Constructors whose signature differs from args (e.g. ProvisioningError)
+        # can't be re-run, so build the instance directly and copy its attributes
+        new_exc = exc.__class__.__new__(exc.__class__, *exc.args)
+        new_exc.__dict__.update(exc.__dict__)
+    new_exc.__context__ = None
+    return new_exc.with_traceback(None)
+
+
+def _detach_traceback(exc: Exception) -> Exception:
+    """Copy an exception and its __cause__ chain without tracebacks
+
+    Stored Results would otherwise pin every frame of the failing call.
+    """
+    head = _copy_exception(exc)
+    current, cause, seen = head, exc.__cause__, {id(exc)}
+    while cause is not None and id(cause) not in seen:
+        seen.add(id(cause))
+        copied = _copy_exception(cause)
+        current.__cause__ = copied
+        current, cause = copied, cause.__cause__
+    return head
+
+
 @dataclass
 class ErrorContext:
     """Enhanced error context information"""
@@ -103,15 +136,15 @@ class Result(Generic[T, E]):
                 current_exc, "__context__", None
             )
 
-        return cls(ResultStatus.FAILURE, error=exc, context=context)
+        return cls(ResultStatus.FAILURE, error=_detach_traceback(exc), context=context)
 
     def is_success(self) -> bool:
         """Check if result is successful"""
-        return self.status == ResultStatus.SUCCESS
+        return self.status is ResultStatus.SUCCESS
 
     def is_failure(self) -> bool:
         """Check if result is failure"""
-        return self.status == ResultStatus.FAILURE
+        return self.status is ResultStatus.FAILURE
 
     def map(self, func: Callable[[T], "R"]) -> "Result[R, E]":
         """Map successful value to new type with enhanced error context"""
@@ -218,26 +251,28 @@ class Result(Generic[T, E]):
         if self.is_success():
             return None
 
-        summary = f"Error: {self.error}"
+        parts = [f"Error: {self.error}"]
 
         if self.context:
             if self.context.operation:
-                summary += f" (Operation: {self.context.operation})"
+                parts.append(f" (Operation: {self.context.operation})")
 
             if self.context.timestamp:
-                import datetime
-
-                dt = datetime.datetime.fromtimestamp(self.context.timestamp)
-                summary += f" (Time: {dt.isoformat()})"
+                timestamp = time.strftime(
+                    "%Y-%m-%dT%H:%M:%S", time.localtime(self.context.timestamp)
+                )
+                parts.append(f" (Time: {timestamp})")
 
             if self.context.chained_errors:
-                summary += f" (Chained errors: {len(self.context.chained_errors)})"
+                parts.append(f" (Chained errors: {len(self.context.chained_errors)})")
                 for i, chained in enumerate(
                     self.context.chained_errors[:3]
                 ):  # Show first 3
-                    summary += f"\n  {i+1}. {chained.get('type', 'Unknown')}: {chained.get('message', 'No message')}"
+                    parts.append(
+                        f"\n  {i+1}. {chained.get('type', 'Unknown')}: {chained.get('message', 'No message')}"
+                    )
 
-        return summary
+        return "".join(parts)
 
     def log_error(self, logger, prefix: str = "Operation failed") -> None:
         """Log error with full context to provided logger"""
@@ -255,13 +290,11 @@ class Result(Generic[T, E]):
         if self.is_success():
             # Only include serializable values
             try:
-                if isinstance(
-                    self.value, (str, int, float, bool, list, dict, type(None))
-                ):
+                if isinstance(self.value, _SERIALIZABLE_TYPES):
                     result_dict["value"] = self.value
                 else:
                     result_dict["value"] = str(self.value)
-            except:
+            except (TypeError, ValueError):
                 result_dict["value"] = "<non-serializable>"
         else:
             result_dict["error"] = str(self.error)
@@ -354,6 +387,12 @@ class IResultHandler(ABC, Generic[T, E]):
         pass
 
 
+@functools.lru_cache(maxsize=128)
+def _format_failure(operation_name: str, error_message: str) -> str:
+    """Format a failure log line, reusing the string for repeated errors"""
+    return f"{operation_name} failed: {error_message}"
+
+
 class LoggingResultHandler(IResultHandler[T, Exception]):
     """Result handler that logs outcomes"""
 
@@ -367,7 +406,7 @@ class LoggingResultHandler(IResultHandler[T, Exception]):
 
     def handle_failure(self, error: Exception) -> None:
         if self.logger:
-            self.logger.error(f"{self.operation_name} failed: {error}")
+            self.logger.error(_format_failure(self.operation_name, str(error)))
 
 
 # Example of improved service with consistent error handling
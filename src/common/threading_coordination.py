@@ -3,9 +3,10 @@ Concurrency and threading coordination utilities to address mixed async/threadin
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import threading
 import time
-import weakref
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
 from enum import Enum
@@ -40,7 +41,6 @@ class ThreadCoordinator:
     def __init__(self, logger=None):
         self.logger = logger
         self._active_threads: Dict[int, ThreadOperationInfo] = {}
-        self._async_tasks: weakref.WeakSet = weakref.WeakSet()
         self._coordination_lock = threading.RLock()
         self._shutdown_event = threading.Event()
         self._coordination_mode = CoordinationMode.AUTO_DETECT
@@ -49,6 +49,10 @@ class ThreadCoordinator:
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._loop_thread_id: Optional[int] = None
 
+        # Persistent loop for sync callers when no registered loop is running
+        self._background_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._background_thread: Optional[threading.Thread] = None
+
     def set_coordination_mode(self, mode: CoordinationMode) -> None:
         """Set the coordination mode for operations"""
         with self._coordination_lock:
@@ -91,21 +95,20 @@ class ThreadCoordinator:
             yield operation_info
         finally:
             with self._coordination_lock:
-                if thread_id in self._active_threads:
-                    duration = time.time() - operation_info.start_time
-                    del self._active_threads[thread_id]
-                    if self.logger:
-                        self.logger.debug(
-                            f"Completed thread operation: {operation_name} in {duration:.2f}s"
-                        )
+                removed = self._active_threads.pop(thread_id, None)
+            if removed is not None and self.logger:
+                duration = time.time() - operation_info.start_time
+                self.logger.debug(
+                    f"Completed thread operation: {operation_name} in {duration:.2f}s"
+                )
 
     async def run_in_thread(self, func: Callable[..., T], *args, **kwargs) -> T:
         """Run a sync function in a thread from async context"""
-        if not self._loop:
-            self.register_async_loop()
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self.register_async_loop(loop)
 
         # Use thread pool for CPU-bound operations
-        loop = self._loop or asyncio.get_event_loop()
 
         def wrapped_func():
             with self.thread_operation(f"async_to_sync_{func.__name__}"):
@@ -113,20 +116,59 @@ class ThreadCoordinator:
 
         return await loop.run_in_executor(None, wrapped_func)
 
-    def run_async_from_sync(self, coro: Awaitable[T]) -> T:
-        """Run an async coroutine from sync context"""
-        if self._loop and self._loop_thread_id == threading.get_ident():
-            # We're already in the event loop thread
+    def run_async_from_sync(self, coro: Awaitable[T], timeout: float = 30.0) -> T:
+        """Run an async coroutine from sync context, cancelling it on timeout"""
+        loop = self._loop
+        background = self._background_thread
+        if (
+            asyncio._get_running_loop() is not None
+            or (loop is not None and self._loop_thread_id == threading.get_ident())
+            or (background is not None and background.ident == threading.get_ident())
+        ):
+            # Blocking here would deadlock the loop running on this thread
             raise RuntimeError("Cannot run async from within the event loop thread")
 
-        # Check if there's a running loop in another thread
-        if self._loop and self._loop.is_running():
-            # Submit to existing loop and wait for result
-            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-            return future.result(timeout=30)  # 30 second timeout
-        else:
-            # No loop running, create new one
-            return asyncio.run(coro)
+        # Submit to a loop running in another thread, or else reuse the
+        # background loop instead of asyncio.run()
+        if loop is None or not loop.is_running():
+            loop = self._get_background_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            # Don't leave a hung coroutine running on the loop
+            future.cancel()
+            raise
+
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Lazily start a daemon thread running a reusable event loop"""
+        with self._coordination_lock:
+            if self._background_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="thread-coordinator-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._background_loop = loop
+                self._background_thread = thread
+            return self._background_loop
+
+    def _stop_background_loop(self) -> None:
+        """Stop and close the background loop if one was started"""
+        with self._coordination_lock:
+            loop, thread = self._background_loop, self._background_thread
+            self._background_loop = None
+            self._background_thread = None
+
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5.0)
+        if not loop.is_running():
+            loop.close()
 
     def is_async_context(self) -> bool:
         """Check if we're currently in an async context"""
@@ -138,22 +180,29 @@ class ThreadCoordinator:
 
     def get_active_operations(self) -> Dict[str, Any]:
         """Get information about active operations"""
+        # Snapshot under the lock, format outside it to keep the critical section short
         with self._coordination_lock:
-            return {
-                "threads": {
-                    tid: {
-                        "operation": info.operation_name,
-                        "duration": time.time() - info.start_time,
-                        "daemon": info.is_daemon,
-                        "mode": info.coordination_mode.value,
-                    }
-                    for tid, info in self._active_threads.items()
-                },
-                "async_tasks": len(self._async_tasks),
-                "coordination_mode": self._coordination_mode.value,
-                "loop_registered": self._loop is not None,
-                "loop_thread": self._loop_thread_id,
-            }
+            items = list(self._active_threads.items())
+            mode = self._coordination_mode.value
+            loop_registered = self._loop is not None
+            loop_thread = self._loop_thread_id
+
+        now = time.time()
+        return {
+            "threads": {
+                tid: {
+                    "operation": info.operation_name,
+                    "duration": now - info.start_time,
+                    "daemon": info.is_daemon,
+                    "mode": info.coordination_mode.value,
+                }
+                for tid, info in items
+            },
+            "async_tasks": 0,
+            "coordination_mode": mode,
+            "loop_registered": loop_registered,
+            "loop_thread": loop_thread,
+        }
 
     async def graceful_shutdown(self, timeout: float = 30.0) -> bool:
         """Gracefully shutdown all operations"""
@@ -172,6 +221,8 @@ class ThreadCoordinator:
                 self.logger.debug(f"Waiting for {len(remaining)} threads to complete")
             await asyncio.sleep(0.1)
 
+        self._stop_background_loop()
+
         # Check if all operations completed
         with self._coordination_lock:
             remaining_operations = len(self._active_threads)
@@ -314,11 +365,16 @@ def mixed_operation(
     """Decorator for operations that can work in both async and sync contexts"""
 
     def decorator(func):
-        coordinator = get_thread_coordinator()
+        # Build both specializations once; only the dispatch happens per call
+        async_impl = async_func(func) if async_func else func
+        sync_impl = sync_func(func) if sync_func else func
 
-        if coordinator.is_async_context():
-            return async_func(func) if async_func else func
-        else:
-            return sync_func(func) if sync_func else func
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if asyncio._get_running_loop() is not None:
+                return async_impl(*args, **kwargs)
+            return sync_impl(*args, **kwargs)
+
+        return wrapper
 
     return decorator
@@ -4,7 +4,8 @@ This layer contains the core domain models, events, and business rules.
 """
 
 from .configuration import ProvisioningConfig, load_config
-from .configuration_factory import ConfigurationFactory, IConfigurationLoader
+from .configuration_factory import ConfigurationFactory
+from .configuration_loaders import IConfigurationLoader
 from .errors import (
     BLEError,
     ErrorCode,
@@ -2,14 +2,29 @@
 Configuration management for the provisioning system
 """
 
+import functools
 import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple
 
+try:
+    import orjson
 
-@dataclass
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(frozen=True)
 class BLEConfig:
     """BLE configuration settings"""
 
@@ -20,7 +35,7 @@ class BLEConfig:
     connection_timeout: int = 30
 
 
-@dataclass
+@dataclass(frozen=True)
 class NetworkConfig:
     """Network configuration settings"""
 
@@ -32,7 +47,7 @@ class NetworkConfig:
     network_scan_cache_ttl: int = 60  # Cache scan results for 60 seconds
 
 
-@dataclass
+@dataclass(frozen=True)
 class SecurityConfig:
     """Security configuration settings - Encryption is ALWAYS enabled"""
 
@@ -46,7 +61,7 @@ class SecurityConfig:
     max_key_age: int = 86400  # Maximum key age: 24 hours
 
 
-@dataclass
+@dataclass(frozen=True)
 class DisplayConfig:
     """Display configuration settings"""
 
@@ -58,7 +73,7 @@ class DisplayConfig:
     text_color: str = "#FFFFFF"
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Logging configuration settings"""
 
@@ -69,7 +84,7 @@ class LoggingConfig:
     console_output: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class SystemConfig:
     """System configuration settings"""
 
@@ -80,9 +95,20 @@ class SystemConfig:
     status_led_pin: int = 16
 
 
-@dataclass
+# Top-level config sections and their dataclass types
+_SECTION_TYPES = {
+    "ble": BLEConfig,
+    "network": NetworkConfig,
+    "security": SecurityConfig,
+    "display": DisplayConfig,
+    "logging": LoggingConfig,
+    "system": SystemConfig,
+}
+
+
+@dataclass(frozen=True)
 class ProvisioningConfig:
-    """Main configuration class"""
+    """Main configuration class (immutable; derive variants with dataclasses.replace)"""
 
     ble: BLEConfig = field(default_factory=BLEConfig)
     network: NetworkConfig = field(default_factory=NetworkConfig)
@@ -93,31 +119,112 @@ class ProvisioningConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            "ble": self.ble.__dict__,
-            "network": self.network.__dict__,
-            "security": self.security.__dict__,
-            "display": self.display.__dict__,
-            "logging": self.logging.__dict__,
-            "system": self.system.__dict__,
-        }
+        # Sections hold only scalars, so a shallow copy of each is a full copy
+        return {name: dict(vars(getattr(self, name))) for name in _SECTION_TYPES}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProvisioningConfig":
         """Create from dictionary"""
         return cls(
-            ble=BLEConfig(**data.get("ble", {})),
-            network=NetworkConfig(**data.get("network", {})),
-            security=SecurityConfig(**data.get("security", {})),
-            display=DisplayConfig(**data.get("display", {})),
-            logging=LoggingConfig(**data.get("logging", {})),
-            system=SystemConfig(**data.get("system", {})),
+            **{
+                name: section_type(**data.get(name, {}))
+                for name, section_type in _SECTION_TYPES.items()
+            }
         )
 
 
-def load_config(config_path: Optional[str] = None) -> ProvisioningConfig:
-    """Load configuration from file or create default"""
-    if config_path is None:
+@functools.lru_cache(maxsize=1)
+def get_default_config() -> ProvisioningConfig:
+    """Shared default configuration instance"""
+    return ProvisioningConfig()
+
+
+# Config file key -> dataclass field renames, with an optional value transform.
+# SECURITY: encryption_enabled is deliberately absent - encryption is always
+# mandatory and must not be disabled from a config file.
+_FILE_FIELD_MAP = {
+    "ble": (
+        ("advertising_name", "device_name", None),
+        ("service_uuid", "service_uuid", None),
+        ("wifi_credentials_char_uuid", "characteristic_uuid", None),
+        ("advertising_timeout", "advertising_interval", lambda v: min(v, 1000)),
+        ("connection_timeout", "connection_timeout", None),
+    ),
+    "security": (
+        ("require_owner_setup", "require_owner_setup", None),
+        ("owner_setup_timeout", "owner_setup_timeout", None),
+    ),
+}
+
+# Sections whose file keys already match the dataclass fields
+_PASSTHROUGH_SECTIONS = ("network", "display", "logging", "system")
+
+
+def _rename_fields(
+    source: Dict[str, Any],
+    table: Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...],
+) -> Dict[str, Any]:
+    """Map config file keys onto dataclass field names using a rename table"""
+    return {
+        dst: (transform(source[src]) if transform else source[src])
+        for src, dst, transform in table
+        if src in source
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> ProvisioningConfig:
+    """Parse a config file; cached per (path, mtime) so edits are picked up"""
+    with open(config_path, "rb") as f:
+        data = _json_loads(f.read())
+
+    # Extract only the fields we understand, ignore unknown ones
+    clean_data = {
+        section: _rename_fields(data[section], table)
+        for section, table in _FILE_FIELD_MAP.items()
+        if section in data
+    }
+
+    # Copy known sections directly
+    for section in _PASSTHROUGH_SECTIONS:
+        if section in data:
+            clean_data[section] = data[section]
+
+    return ProvisioningConfig.from_dict(clean_data)
+
+
+# Discovered config file path; "not found" is never cached, so a file created
+# later in the process is still picked up
+_CONFIG_PATH_CACHE: Optional[str] = None
+
+
+def invalidate_config_path_cache() -> None:
+    """Forget the discovered config file path so the next load searches again"""
+    global _CONFIG_PATH_CACHE
+    _CONFIG_PATH_CACHE = None
+
+
+def first_existing_path(candidates: Sequence[str]) -> Optional[str]:
+    """Return the first candidate that exists, listing each parent directory once"""
+    listings: Dict[str, Optional[Set[str]]] = {}
+    for candidate in candidates:
+        dirname, basename = os.path.split(candidate)
+        if dirname not in listings:
+            try:
+                with os.scandir(dirname or ".") as entries:
+                    listings[dirname] = {entry.name for entry in entries}
+            except OSError:
+                listings[dirname] = None
+        names = listings[dirname]
+        if names is not None and basename in names:
+            return candidate
+    return None
+
+
+def _find_config_file() -> Optional[str]:
+    """Find configuration file in standard locations, caching the path once found"""
+    global _CONFIG_PATH_CACHE
+    if _CONFIG_PATH_CACHE is None:
         # Try multiple locations
         possible_paths = [
             "/etc/rockpi-provisioning/config.json",
@@ -125,63 +232,26 @@ def load_config(config_path: Optional[str] = None) -> ProvisioningConfig:
             "config.json",
         ]
 
-        for path in possible_paths:
-            if os.path.exists(path):
-                config_path = path
-                break
+        _CONFIG_PATH_CACHE = first_existing_path(possible_paths)
+    return _CONFIG_PATH_CACHE
 
-    if config_path and os.path.exists(config_path):
+
+def load_config(config_path: Optional[str] = None) -> ProvisioningConfig:
+    """Load configuration from file or create default"""
+    if config_path is None:
+        config_path = _find_config_file()
+
+    if config_path and os.path.isfile(config_path):
         try:
-            with open(config_path, "r") as f:
-                data = json.load(f)
-
-            # Extract only the fields we understand, ignore unknown ones
-            clean_data = {}
-
-            # Handle BLE config
-            if "ble" in data:
-                ble_data = data["ble"]
-                clean_ble = {}
-                if "advertising_name" in ble_data:
-                    clean_ble["device_name"] = ble_data["advertising_name"]
-                if "service_uuid" in ble_data:
-                    clean_ble["service_uuid"] = ble_data["service_uuid"]
-                if "wifi_credentials_char_uuid" in ble_data:
-                    clean_ble["characteristic_uuid"] = ble_data[
-                        "wifi_credentials_char_uuid"
-                    ]
-                if "advertising_timeout" in ble_data:
-                    clean_ble["advertising_interval"] = min(
-                        ble_data["advertising_timeout"], 1000
-                    )
-                if "connection_timeout" in ble_data:
-                    clean_ble["connection_timeout"] = ble_data["connection_timeout"]
-                clean_data["ble"] = clean_ble
-
-            # Handle security config
-            if "security" in data:
-                sec_data = data["security"]
-                clean_sec = {}
-                if "require_owner_setup" in sec_data:
-                    clean_sec["require_owner_setup"] = sec_data["require_owner_setup"]
-                if "owner_setup_timeout" in sec_data:
-                    clean_sec["owner_setup_timeout"] = sec_data["owner_setup_timeout"]
-                # SECURITY: Remove encryption_enabled bypass - encryption is always mandatory
-                # No longer setting encryption_enabled from config to prevent security bypass
-                clean_data["security"] = clean_sec
-
-            # Copy known sections directly
-            for section in ["network", "display", "logging", "system"]:
-                if section in data:
-                    clean_data[section] = data[section]
-
-            return ProvisioningConfig.from_dict(clean_data)
+            return _load_config_cached(
+                os.path.abspath(config_path), os.stat(config_path).st_mtime
+            )
         except Exception as e:
             import logging
             logging.getLogger(__name__).warning(f"Failed to load config from {config_path}: {e}")
 
     # Return default configuration
-    return ProvisioningConfig()
+    return get_default_config()
 
 
 def save_config(config: ProvisioningConfig, config_path: str = "config.json") -> bool:
@@ -190,10 +260,16 @@ def save_config(config: ProvisioningConfig, config_path: str = "config.json") ->
         # Ensure directory exists
         Path(config_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(config_path, "w") as f:
-            json.dump(config.to_dict(), f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(config_path, "wb") as f:
+                f.write(orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, "w") as f:
+                json.dump(config.to_dict(), f, indent=2)
+        # The new file may take precedence over the previously discovered one
+        invalidate_config_path_cache()
         return True
     except Exception as e:
-                    import logging
-            logging.getLogger(__name__).error(f"Error saving config: {e}")
+        import logging
+        logging.getLogger(__name__).error(f"Error saving config: {e}")
         return False
@@ -2,76 +2,183 @@
 Configuration factory for creating appropriate configurations with SOC-aware settings
 """
 
+import asyncio
+import bisect
+import dataclasses
+import functools
 import json
+import logging
 import os
-from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
-from ..common.result_handling import Result
-from ..domain.errors import ErrorCode, ErrorSeverity, SystemError
-from ..infrastructure.hardware_abstraction import HALFactory
-from .configuration import ProvisioningConfig
-from .soc_specifications import SOCFamily, SOCSpecification, soc_manager
-
-
-class IConfigurationLoader(ABC):
-    """Abstract configuration loader interface"""
-
-    @abstractmethod
-    def can_load(self, path: str) -> bool:
-        """Check if this loader can handle the given path"""
-        pass
-
-    @abstractmethod
-    def load(self, path: str) -> Dict[str, Any]:
-        """Load configuration from path"""
-        pass
-
-
-class JsonConfigurationLoader(IConfigurationLoader):
-    """JSON configuration loader"""
+try:
+    import jsonschema
 
-    def can_load(self, path: str) -> bool:
-        return path.endswith(".json")
-
-    def load(self, path: str) -> Dict[str, Any]:
-        with open(path, "r") as f:
-            return json.load(f)
-
-
-class YamlConfigurationLoader(IConfigurationLoader):
-    """YAML configuration loader (example extension)"""
-
-    def can_load(self, path: str) -> bool:
-        return path.endswith((".yaml", ".yml"))
-
-    def load(self, path: str) -> Dict[str, Any]:
-        try:
-            import yaml
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
 
-            with open(path, "r") as f:
-                return yaml.safe_load(f)
-        except ImportError:
-            raise ImportError("PyYAML required for YAML configuration")
+from ..common.result_handling import Result
+from ..domain.errors import ErrorCode, ErrorSeverity, SystemError, ValidationError
+from .configuration import (
+    BLEConfig,
+    DisplayConfig,
+    LoggingConfig,
+    NetworkConfig,
+    ProvisioningConfig,
+    SecurityConfig,
+    SystemConfig,
+    first_existing_path,
+    get_default_config,
+)
+from .configuration_loaders import (
+    ConfigurationLoaderRegistry,
+    IConfigurationLoader,
+    JsonConfigurationLoader,
+    YamlConfigurationLoader,
+)
+
+if TYPE_CHECKING:
+    from .soc_specifications import SOCSpecification
+
+# Valid field names per config section, computed once at import
+_BLE_FIELDS = frozenset(f.name for f in dataclasses.fields(BLEConfig))
+_NETWORK_FIELDS = frozenset(f.name for f in dataclasses.fields(NetworkConfig))
+_SECURITY_FIELDS = frozenset(f.name for f in dataclasses.fields(SecurityConfig))
+_DISPLAY_FIELDS = frozenset(f.name for f in dataclasses.fields(DisplayConfig))
+_LOGGING_FIELDS = frozenset(f.name for f in dataclasses.fields(LoggingConfig))
+_SYSTEM_FIELDS = frozenset(f.name for f in dataclasses.fields(SystemConfig))
+
+# JSON types for the scalar field annotations used by the config dataclasses
+_JSON_TYPES = {str: "string", bool: "boolean", int: "integer", float: "number"}
+
+
+def _section_schema(section_type: type) -> Dict[str, Any]:
+    """Derive a permissive JSON schema for a config section from its dataclass"""
+    return {
+        "type": "object",
+        "properties": {
+            f.name: {"type": _JSON_TYPES[f.type]}
+            for f in dataclasses.fields(section_type)
+            if f.type in _JSON_TYPES
+        },
+    }
+
+
+# Schema for configuration data; unknown keys are allowed and ignored
+CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ble": _section_schema(BLEConfig),
+        "network": _section_schema(NetworkConfig),
+        "security": _section_schema(SecurityConfig),
+        "display": _section_schema(DisplayConfig),
+        "logging": _section_schema(LoggingConfig),
+        "system": _section_schema(SystemConfig),
+        "hardware": {"type": "object", "properties": {"soc": {"type": "string"}}},
+    },
+}
+
+# Compiled once at import and shared by every factory instance
+_CONFIG_VALIDATOR = (
+    jsonschema.validators.validator_for(CONFIG_SCHEMA)(CONFIG_SCHEMA)
+    if JSONSCHEMA_AVAILABLE
+    else None
+)
+
+
+def _validate_config_data(data: Dict[str, Any]) -> None:
+    """Validate configuration data against CONFIG_SCHEMA when jsonschema is installed"""
+    if _CONFIG_VALIDATOR is None:
+        return
+    error = jsonschema.exceptions.best_match(_CONFIG_VALIDATOR.iter_errors(data))
+    if error is not None:
+        location = ".".join(str(part) for part in error.absolute_path) or "<root>"
+        raise ValidationError(
+            ErrorCode.CONFIG_INVALID_FORMAT,
+            f"Invalid configuration at {location}: {error.message}",
+            ErrorSeverity.HIGH,
+        )
 
 
-class ConfigurationLoaderRegistry:
-    """Registry for configuration loaders"""
+# BLE device names for specific SOCs, then per-family (SOCFamily value) templates
+_DEVICE_NAME_BY_SOC = {
+    "OP1": "RockPi4B-Plus",
+    "RK3399": "RockPi4",
+    "BCM2712": "RaspberryPi5",
+    "BCM2711": "RaspberryPi4",
+    "H618": "OrangePi-H618",
+    "H616": "OrangePi-H616",
+}
+_DEVICE_NAME_BY_FAMILY = {
+    "broadcom": "RaspberryPi",
+    "allwinner": "OrangePi",
+    "mediatek": "MediaTek-{name}",
+    "qualcomm": "Qualcomm-{name}",
+}
+_DEFAULT_DEVICE_NAME = "DigitalSignage-{name}"
+
+# (advertising_interval, connection_timeout) keyed by Bluetooth major version
+_BLE_TIMING_BY_BT_MAJOR = {"5": (50, 15), "4": (100, 30)}
+
+# Tiers are looked up with bisect_right: values[i] applies from thresholds[i - 1] up
+_CPU_CORE_THRESHOLDS = (4, 6)
+_HEALTH_CHECK_INTERVALS = (60, 30, 15)
+_MEMORY_GB_THRESHOLDS = (2, 4)
+_LOG_ROTATION_BY_MEMORY = (  # (max_file_size, backup_count)
+    (5 * 1024 * 1024, 3),
+    (10 * 1024 * 1024, 5),
+    (20 * 1024 * 1024, 10),
+)
+
+# (environment variable, config section, field) applied by create_from_environment
+_ENV_OVERRIDES = (
+    ("BLE_DEVICE_NAME", "ble", "device_name"),
+    ("WIFI_INTERFACE", "network", "interface_name"),
+    ("LOG_LEVEL", "logging", "level"),
+)
+
+
+def _get_soc_manager():
+    """Import the SOC manager on first use; it pulls in hardware detection code"""
+    from .soc_specifications import soc_manager
+
+    return soc_manager
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_soc() -> Optional["SOCSpecification"]:
+    """Detect the running SOC once per process; hardware doesn't change at runtime"""
+    return _get_soc_manager().detect_soc()
+
+
+# HAL probe results per SOC name; the hardware doesn't change while we run
+_HAL_PROBE_CACHE: Dict[str, Tuple[Dict[str, Any], Mapping[str, int], List[str]]] = {}
+
+
+def _hal_probes(
+    soc_spec: "SOCSpecification",
+) -> Tuple[Dict[str, Any], Mapping[str, int], List[str]]:
+    """Return (display_info, gpio_mapping, network_interfaces), probing once per SOC"""
+    probes = _HAL_PROBE_CACHE.get(soc_spec.name)
+    if probes is None:
+        # Create HAL for hardware-specific optimizations
+        from ..infrastructure.hardware_abstraction import HALFactory
 
-    def __init__(self):
-        self._loaders = []
+        hal = HALFactory.create_hal(soc_spec)
+        hal.initialize()
+        probes = (
+            hal.get_display_info(),
+            hal.get_gpio_mapping(),
+            hal.get_network_interfaces(),
+        )
+        _HAL_PROBE_CACHE[soc_spec.name] = probes
+    return probes
 
-    def register_loader(self, loader: IConfigurationLoader):
-        """Register a new configuration loader"""
-        self._loaders.append(loader)
 
-    def get_loader(self, path: str) -> Optional[IConfigurationLoader]:
-        """Get appropriate loader for path"""
-        for loader in self._loaders:
-            if loader.can_load(path):
-                return loader
-        return None
+def invalidate_hal_probe_cache() -> None:
+    """Drop cached HAL probe results, e.g. after a hardware change or SIGHUP"""
+    _HAL_PROBE_CACHE.clear()
 
 
 class ConfigurationFactory:
@@ -83,29 +190,49 @@ class ConfigurationFactory:
         self.registry.register_loader(JsonConfigurationLoader())
         # self.registry.register_loader(YamlConfigurationLoader())  # Optional
 
+        # Loaded configs keyed by absolute path, invalidated on mtime change
+        self._cache: Dict[str, Tuple[float, ProvisioningConfig]] = {}
+        # SOC-optimized default configs keyed by SOC name
+        self._soc_config_cache: Dict[str, ProvisioningConfig] = {}
+        # Discovered config file path; "not found" is not cached
+        self._found_path: Optional[str] = None
+
     def load_config(self, config_path: Optional[str] = None) -> ProvisioningConfig:
         """Load configuration using appropriate loader with SOC optimization"""
         if config_path is None:
             config_path = self._find_config_file()
 
-        if config_path and Path(config_path).exists():
+        if config_path and os.path.isfile(config_path):
             loader = self.registry.get_loader(config_path)
             if loader:
                 try:
-                    data = loader.load(config_path)
-                    return self._create_config_from_data(data)
+                    abs_path = os.path.abspath(config_path)
+                    mtime = os.stat(abs_path).st_mtime
+                    cached = self._cache.get(abs_path)
+                    if cached is None or cached[0] != mtime:
+                        data = loader.load(config_path)
+                        cached = (mtime, self._create_config_from_data(data))
+                        self._cache[abs_path] = cached
+                    return cached[1]
                 except Exception as e:
                     # Log error and fall back to SOC-optimized default
-                    import logging
-            logging.getLogger(__name__).warning(f"Failed to load config from {config_path}: {e}")
+                    logging.getLogger(__name__).warning(
+                        f"Failed to load config from {config_path}: {e}"
+                    )
 
         return self.create_default()  # SOC-optimized default configuration
 
+    async def load_config_async(
+        self, config_path: Optional[str] = None
+    ) -> ProvisioningConfig:
+        """Load configuration like load_config, reading the file off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.load_config, config_path)
+
     def create_from_file(self, file_path: str) -> Result[ProvisioningConfig, Exception]:
         """Create configuration from JSON file with SOC optimization"""
         try:
-            path = Path(file_path)
-            if not path.exists():
+            if not os.path.isfile(file_path):
                 return Result.failure(
                     SystemError(
                         ErrorCode.CONFIG_FILE_NOT_FOUND,
@@ -136,6 +263,8 @@ class ConfigurationFactory:
                     ErrorSeverity.HIGH,
                 )
             )
+        except ValidationError as e:
+            return Result.failure(e)
         except Exception as e:
             return Result.failure(
                 SystemError(
@@ -164,21 +293,16 @@ class ConfigurationFactory:
     def create_default(self) -> ProvisioningConfig:
         """Create default configuration optimized for detected SOC"""
         # Detect current SOC
-        soc_spec = soc_manager.detect_soc()
-
-        # Create base configuration
-        config = ProvisioningConfig()
+        soc_spec = _detect_soc()
+        if not soc_spec:
+            return get_default_config()
 
-        # Apply SOC-specific optimizations
-        if soc_spec:
-            config = self._apply_soc_optimizations(config, soc_spec)
-
-        return config
+        return self._soc_default_config(soc_spec)
 
     def create_for_soc(self, soc_name: str) -> Result[ProvisioningConfig, Exception]:
         """Create configuration optimized for specific SOC"""
         try:
-            soc_spec = soc_manager.get_soc_by_name(soc_name)
+            soc_spec = _get_soc_manager().get_soc_by_name(soc_name)
             if not soc_spec:
                 return Result.failure(
                     SystemError(
@@ -188,9 +312,7 @@ class ConfigurationFactory:
                     )
                 )
 
-            config = ProvisioningConfig()
-            config = self._apply_soc_optimizations(config, soc_spec)
-            return Result.success(config)
+            return Result.success(self._soc_default_config(soc_spec))
 
         except Exception as e:
             return Result.failure(
@@ -207,18 +329,25 @@ class ConfigurationFactory:
             config = self.create_default()  # SOC-optimized default
 
             # Override with environment variables if present
-            if os.getenv("BLE_DEVICE_NAME"):
-                config.ble.device_name = os.getenv("BLE_DEVICE_NAME")
-
-            if os.getenv("WIFI_INTERFACE"):
-                config.network.interface_name = os.getenv("WIFI_INTERFACE")
-
-            if os.getenv("LOG_LEVEL"):
-                config.logging.level = os.getenv("LOG_LEVEL")
+            env = os.environ
+            overrides: Dict[str, Dict[str, str]] = {}
+            for env_var, section, field_name in _ENV_OVERRIDES:
+                value = env.get(env_var)
+                if value:
+                    overrides.setdefault(section, {})[field_name] = value
+            if overrides:
+                config = dataclasses.replace(
+                    config,
+                    **{
+                        section: dataclasses.replace(getattr(config, section), **fields)
+                        for section, fields in overrides.items()
+                    },
+                )
 
             # SOC-specific environment overrides
-            if os.getenv("SOC_NAME"):
-                soc_spec = soc_manager.get_soc_by_name(os.getenv("SOC_NAME"))
+            soc_name = env.get("SOC_NAME")
+            if soc_name:
+                soc_spec = _get_soc_manager().get_soc_by_name(soc_name)
                 if soc_spec:
                     config = self._apply_soc_optimizations(config, soc_spec)
 
@@ -233,8 +362,18 @@ class ConfigurationFactory:
                 )
             )
 
+    def invalidate_config_path_cache(self) -> None:
+        """Forget the discovered config file path so the next load searches again"""
+        self._found_path = None
+
     def _find_config_file(self) -> Optional[str]:
-        """Find configuration file in standard locations"""
+        """Find configuration file in standard locations, caching the path once found"""
+        if self._found_path is None:
+            self._found_path = self._search_config_file()
+        return self._found_path
+
+    def _search_config_file(self) -> Optional[str]:
+        """Search the standard locations for a configuration file"""
         possible_paths = [
             "/etc/rockpi-provisioning/config.json",
             "config/unified_config.json",
@@ -244,189 +383,133 @@ class ConfigurationFactory:
             "config.yaml",
         ]
 
-        for path in possible_paths:
-            if Path(path).exists():
-                return path
-        return None
+        return first_existing_path(possible_paths)
 
     def _create_config_from_data(self, data: Dict[str, Any]) -> ProvisioningConfig:
         """Create ProvisioningConfig from loaded data with SOC awareness"""
+        _validate_config_data(data)
         config = self._build_config_from_dict(data)
 
         # Apply SOC optimizations if not explicitly overridden
         if "hardware" not in data or "soc" not in data.get("hardware", {}):
-            soc_spec = soc_manager.detect_soc()
+            soc_spec = _detect_soc()
             if soc_spec:
                 config = self._apply_soc_optimizations(config, soc_spec)
         else:
             # Use specified SOC from config
             soc_name = data["hardware"]["soc"]
-            soc_spec = soc_manager.get_soc_by_name(soc_name)
+            soc_spec = _get_soc_manager().get_soc_by_name(soc_name)
             if soc_spec:
                 config = self._apply_soc_optimizations(config, soc_spec)
 
         return config
 
+    def _soc_default_config(self, soc_spec: "SOCSpecification") -> ProvisioningConfig:
+        """Return the (shared, immutable) default configuration optimized for a SOC"""
+        cached = self._soc_config_cache.get(soc_spec.name)
+        if cached is None:
+            cached = self._apply_soc_optimizations(get_default_config(), soc_spec)
+            self._soc_config_cache[soc_spec.name] = cached
+        return cached
+
     def _apply_soc_optimizations(
-        self, config: ProvisioningConfig, soc_spec: SOCSpecification
+        self, config: ProvisioningConfig, soc_spec: "SOCSpecification"
     ) -> ProvisioningConfig:
         """Apply SOC-specific optimizations to configuration"""
 
-        # Create HAL for hardware-specific optimizations
-        hal = HALFactory.create_hal(soc_spec)
-        hal.initialize()
+        display_info, gpio_mapping, network_interfaces = _hal_probes(soc_spec)
+
+        # Collect per-section overrides, then derive the new immutable config
+        ble = {}
+        network = {}
+        display = {}
+        system = {}
 
         # Update device name based on SOC
-        if soc_spec.name == "OP1":
-            config.ble.device_name = "RockPi4B-Plus"
-        elif soc_spec.name == "RK3399":
-            config.ble.device_name = "RockPi4"
-        elif soc_spec.family == SOCFamily.BROADCOM:
-            if soc_spec.name == "BCM2712":
-                config.ble.device_name = "RaspberryPi5"
-            elif soc_spec.name == "BCM2711":
-                config.ble.device_name = "RaspberryPi4"
-            else:
-                config.ble.device_name = "RaspberryPi"
-        elif soc_spec.family == SOCFamily.ALLWINNER:
-            if soc_spec.name in ["H618", "H616"]:
-                config.ble.device_name = f"OrangePi-{soc_spec.name}"
-            else:
-                config.ble.device_name = "OrangePi"
-        elif soc_spec.family == SOCFamily.MEDIATEK:
-            config.ble.device_name = f"MediaTek-{soc_spec.name}"
-        elif soc_spec.family == SOCFamily.QUALCOMM:
-            config.ble.device_name = f"Qualcomm-{soc_spec.name}"
-        else:
-            config.ble.device_name = f"DigitalSignage-{soc_spec.name}"
+        name_format = _DEVICE_NAME_BY_FAMILY.get(
+            soc_spec.family.value, _DEFAULT_DEVICE_NAME
+        )
+        ble["device_name"] = _DEVICE_NAME_BY_SOC.get(
+            soc_spec.name
+        ) or name_format.format(name=soc_spec.name)
 
         # Optimize BLE settings based on Bluetooth version
-        if soc_spec.connectivity.bluetooth_version.startswith("5"):
-            config.ble.advertising_interval = 50  # Faster advertising for BT 5.0+
-            config.ble.connection_timeout = 15  # Shorter timeout for better performance
-        elif soc_spec.connectivity.bluetooth_version.startswith("4"):
-            config.ble.advertising_interval = 100
-            config.ble.connection_timeout = 30
+        ble_timing = _BLE_TIMING_BY_BT_MAJOR.get(
+            soc_spec.connectivity.bluetooth_version[:1]
+        )
+        if ble_timing:
+            # BT 5.0+ gets faster advertising and a shorter timeout
+            ble["advertising_interval"], ble["connection_timeout"] = ble_timing
 
         # Optimize network settings based on capabilities
-        if "802.11ac" in soc_spec.connectivity.wifi_standards:
-            config.network.wifi_scan_timeout = 5  # Faster scanning
+        if soc_spec.connectivity.has_wifi_ac:
+            network["wifi_scan_timeout"] = 5  # Faster scanning
         if "802.11ax" in soc_spec.connectivity.wifi_standards:
-            config.network.wifi_scan_timeout = 3  # Even faster for WiFi 6
+            network["wifi_scan_timeout"] = 3  # Even faster for WiFi 6
 
         # Optimize display settings based on capabilities
-        display_info = hal.get_display_info()
         if "4K" in display_info.get("max_resolution", ""):
-            config.display.width = 3840
-            config.display.height = 2160
-            config.display.qr_size = 800  # Larger QR for 4K displays
+            display["width"] = 3840
+            display["height"] = 2160
+            display["qr_size"] = 800  # Larger QR for 4K displays
         elif "1080p" in display_info.get("max_resolution", ""):
-            config.display.width = 1920
-            config.display.height = 1080
-            config.display.qr_size = 400
+            display["width"] = 1920
+            display["height"] = 1080
+            display["qr_size"] = 400
 
         # Set GPIO pins based on HAL mapping
-        gpio_mapping = hal.get_gpio_mapping()
         if "reset_button" in gpio_mapping:
-            config.system.factory_reset_pin = gpio_mapping["reset_button"]
+            system["factory_reset_pin"] = gpio_mapping["reset_button"]
         if "status_led_green" in gpio_mapping:
-            config.system.status_led_pin = gpio_mapping["status_led_green"]
+            system["status_led_pin"] = gpio_mapping["status_led_green"]
 
-        # Performance optimizations based on SOC capabilities
-        if soc_spec.performance.cpu_cores >= 6:
-            config.system.health_check_interval = 15  # More frequent health checks
-        elif soc_spec.performance.cpu_cores >= 4:
-            config.system.health_check_interval = 30
-        else:
-            config.system.health_check_interval = 60  # Less frequent for lower-end SOCs
-
-        # Memory-based optimizations
-        if soc_spec.performance.memory_max_gb >= 4:
-            config.logging.max_file_size = (
-                20 * 1024 * 1024
-            )  # 20MB for high-memory systems
-            config.logging.backup_count = 10
-        elif soc_spec.performance.memory_max_gb >= 2:
-            config.logging.max_file_size = 10 * 1024 * 1024  # 10MB
-            config.logging.backup_count = 5
-        else:
-            config.logging.max_file_size = 5 * 1024 * 1024  # 5MB for low-memory systems
-            config.logging.backup_count = 3
+        # Performance optimizations based on SOC capabilities:
+        # more frequent health checks on bigger SOCs
+        system["health_check_interval"] = _HEALTH_CHECK_INTERVALS[
+            bisect.bisect_right(_CPU_CORE_THRESHOLDS, soc_spec.performance.cpu_cores)
+        ]
+
+        # Memory-based optimizations: larger log rotation on high-memory systems
+        memory_gb = soc_spec.performance.memory_max_gb
+        max_file_size, backup_count = _LOG_ROTATION_BY_MEMORY[
+            bisect.bisect_right(_MEMORY_GB_THRESHOLDS, memory_gb)
+        ]
 
         # Power management optimizations
         if soc_spec.power.poe_support:
-            config.system.provisioning_timeout = 600  # Longer timeout for PoE systems
+            system["provisioning_timeout"] = 600  # Longer timeout for PoE systems
 
         # Network interface optimization using HAL
-        network_interfaces = hal.get_network_interfaces()
         if "wlan0" in network_interfaces:
-            config.network.interface_name = "wlan0"
+            network["interface_name"] = "wlan0"
         elif network_interfaces:
-            config.network.interface_name = network_interfaces[0]
+            network["interface_name"] = network_interfaces[0]
         else:
-            config.network.interface_name = "wlan0"  # Safe default
-
-        return config
+            network["interface_name"] = "wlan0"  # Safe default
+
+        return dataclasses.replace(
+            config,
+            ble=dataclasses.replace(config.ble, **ble),
+            network=dataclasses.replace(config.network, **network),
+            display=dataclasses.replace(config.display, **display),
+            logging=dataclasses.replace(
+                config.logging, max_file_size=max_file_size, backup_count=backup_count
+            ),
+            system=dataclasses.replace(config.system, **system),
+        )
 
     def _build_config_from_dict(self, config_dict: Dict) -> ProvisioningConfig:
         """Build configuration object from dictionary with SOC awareness"""
-        from .configuration import (
-            BLEConfig,
-            DisplayConfig,
-            LoggingConfig,
-            NetworkConfig,
-            SecurityConfig,
-            SystemConfig,
-        )
 
-        # Build individual config sections
-        ble_config = BLEConfig()
-        if "ble" in config_dict:
-            ble_data = config_dict["ble"]
-            for key, value in ble_data.items():
-                if hasattr(ble_config, key):
-                    setattr(ble_config, key, value)
-
-        network_config = NetworkConfig()
-        if "network" in config_dict:
-            network_data = config_dict["network"]
-            for key, value in network_data.items():
-                if hasattr(network_config, key):
-                    setattr(network_config, key, value)
-
-        security_config = SecurityConfig()
-        if "security" in config_dict:
-            security_data = config_dict["security"]
-            for key, value in security_data.items():
-                if hasattr(security_config, key):
-                    setattr(security_config, key, value)
-
-        display_config = DisplayConfig()
-        if "display" in config_dict:
-            display_data = config_dict["display"]
-            for key, value in display_data.items():
-                if hasattr(display_config, key):
-                    setattr(display_config, key, value)
-
-        logging_config = LoggingConfig()
-        if "logging" in config_dict:
-            logging_data = config_dict["logging"]
-            for key, value in logging_data.items():
-                if hasattr(logging_config, key):
-                    setattr(logging_config, key, value)
-
-        system_config = SystemConfig()
-        if "system" in config_dict:
-            system_data = config_dict["system"]
-            for key, value in system_data.items():
-                if hasattr(system_config, key):
-                    setattr(system_config, key, value)
+        def section(name: str, valid_fields: frozenset) -> Dict[str, Any]:
+            data = config_dict.get(name) or {}
+            return {k: v for k, v in data.items() if k in valid_fields}
 
         return ProvisioningConfig(
-            ble=ble_config,
-            network=network_config,
-            security=security_config,
-            display=display_config,
-            logging=logging_config,
-            system=system_config,
+            ble=BLEConfig(**section("ble", _BLE_FIELDS)),
+            network=NetworkConfig(**section("network", _NETWORK_FIELDS)),
+            security=SecurityConfig(**section("security", _SECURITY_FIELDS)),
+            display=DisplayConfig(**section("display", _DISPLAY_FIELDS)),
+            logging=LoggingConfig(**section("logging", _LOGGING_FIELDS)),
+            system=SystemConfig(**section("system", _SYSTEM_FIELDS)),
         )
@@ -0,0 +1,122 @@
+"""
+Configuration loaders for the supported configuration file formats
+"""
+
+import json
+import mmap
+import os
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class IConfigurationLoader(ABC):
+    """Abstract configuration loader interface"""
+
+    @abstractmethod
+    def can_load(self, path: str) -> bool:
+        """Check if this loader can handle the given path"""
+        pass
+
+    @abstractmethod
+    def load(self, path: str) -> Dict[str, Any]:
+        """Load configuration from path"""
+        pass
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        """File extensions handled purely by suffix (empty for custom can_load logic)"""
+        return ()
+
+
+class JsonConfigurationLoader(IConfigurationLoader):
+    """JSON configuration loader"""
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        return (".json",)
+
+    def can_load(self, path: str) -> bool:
+        return path.endswith(".json")
+
+    # Below this size a plain read() is cheaper than setting up a mapping
+    MMAP_THRESHOLD = 64 * 1024
+
+    def load(self, path: str) -> Dict[str, Any]:
+        if ORJSON_AVAILABLE and os.path.getsize(path) > self.MMAP_THRESHOLD:
+            return self._load_mapped(path)
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+    def _load_mapped(self, path: str) -> Dict[str, Any]:
+        """Parse a large file straight from a read-only mapping, without a copy"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        try:
+            view = memoryview(mapped)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+        finally:
+            mapped.close()
+
+
+class YamlConfigurationLoader(IConfigurationLoader):
+    """YAML configuration loader (example extension)"""
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        return (".yaml", ".yml")
+
+    def can_load(self, path: str) -> bool:
+        return path.endswith((".yaml", ".yml"))
+
+    def load(self, path: str) -> Dict[str, Any]:
+        try:
+            import yaml
+
+            with open(path, "r") as f:
+                return yaml.safe_load(f)
+        except ImportError:
+            raise ImportError("PyYAML required for YAML configuration")
+
+
+class ConfigurationLoaderRegistry:
+    """Registry for configuration loaders"""
+
+    def __init__(self):
+        self._loaders = []
+        self._ext_map: Dict[str, IConfigurationLoader] = {}
+
+    def register_loader(self, loader: IConfigurationLoader):
+        """Register a new configuration loader"""
+        self._loaders.append(loader)
+        for ext in loader.extensions:
+            # First registration wins, matching the list scan order
+            self._ext_map.setdefault(sys.intern(ext.lower()), loader)
+
+    def get_loader(self, path: str) -> Optional[IConfigurationLoader]:
+        """Get appropriate loader for path"""
+        loader = self._ext_map.get(path[path.rfind(".") :].lower())
+        if loader is not None:
+            return loader
+
+        # Fall back to can_load for loaders with custom matching logic
+        for loader in self._loaders:
+            if loader.can_load(path):
+                return loader
+        return None
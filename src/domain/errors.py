@@ -36,8 +36,13 @@ class ErrorCode(Enum):
     # System errors
     DEVICE_INFO_UNAVAILABLE = "DEVICE_INFO_UNAVAILABLE"
     CONFIG_LOAD_FAILED = "CONFIG_LOAD_FAILED"
+    CONFIG_FILE_NOT_FOUND = "CONFIG_FILE_NOT_FOUND"
+    CONFIG_INVALID_FORMAT = "CONFIG_INVALID_FORMAT"
     CONFIG_WRITE_FAILED = "CONFIG_WRITE_FAILED"
     CONFIG_READ_FAILED = "CONFIG_READ_FAILED"
+    CONFIG_PARSE_ERROR = "CONFIG_PARSE_ERROR"
+    CONFIG_PERMISSION_ERROR = "CONFIG_PERMISSION_ERROR"
+    CONFIG_VALIDATION_ERROR = "CONFIG_VALIDATION_ERROR"
     HARDWARE_ERROR = "HARDWARE_ERROR"
     RESOURCE_EXHAUSTED = "RESOURCE_EXHAUSTED"
 
@@ -3,11 +3,15 @@ Event bus for decoupled communication between layers
 """
 
 import asyncio
+import functools
+import itertools
+import os
+import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
-from uuid import uuid4
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 
 class EventType(Enum):
@@ -55,21 +59,44 @@ class EventType(Enum):
 class Event:
     """Event data structure"""
 
+    __slots__ = ("type", "data", "timestamp", "source", "event_id")
+
     type: EventType
     data: Any
-    timestamp: datetime
+    timestamp: int  # time.monotonic_ns() at publish
     source: str
     event_id: str
 
+    @property
+    def wall_time(self) -> datetime:
+        """Approximate wall-clock time of the event, for display"""
+        age_ns = time.monotonic_ns() - self.timestamp
+        return datetime.fromtimestamp(time.time() - age_ns / 1e9)
+
+
+# Shared by every bus, so ids stay unique after reset_event_bus() replaces the bus
+_ID_COUNTER = itertools.count()
+
 
 class EventBus:
     """Event bus for publish-subscribe communication"""
 
     def __init__(self):
         self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = {}
-        self._async_subscribers: Dict[EventType, List[Callable[[Event], Any]]] = {}
-        self._event_history: List[Event] = []
+        # Handlers are stored with a precomputed "is coroutine function" flag
+        self._async_subscribers: Dict[
+            EventType, List[Tuple[Callable[[Event], Any], bool]]
+        ] = {}
         self._max_history = 1000
+        self._event_history: Deque[Event] = deque(maxlen=self._max_history)
+        # Same events as _event_history, grouped by type for filtered queries
+        self._history_by_type: Dict[EventType, Deque[Event]] = defaultdict(deque)
+        # Process-local ids: "<pid>-<n>" is unique without reading urandom
+        self._id_prefix = f"{os.getpid()}-"
+
+    def _next_id(self) -> str:
+        """Next process-local event/subscription id"""
+        return f"{self._id_prefix}{next(_ID_COUNTER)}"
 
     def subscribe(self, event_type: EventType, handler: Callable[[Event], None]) -> str:
         """Subscribe to synchronous events"""
@@ -77,7 +104,7 @@ class EventBus:
             self._subscribers[event_type] = []
 
         self._subscribers[event_type].append(handler)
-        return str(uuid4())
+        return self._next_id()
 
     def subscribe_async(
         self, event_type: EventType, handler: Callable[[Event], Any]
@@ -86,8 +113,10 @@ class EventBus:
         if event_type not in self._async_subscribers:
             self._async_subscribers[event_type] = []
 
-        self._async_subscribers[event_type].append(handler)
-        return str(uuid4())
+        self._async_subscribers[event_type].append(
+            (handler, asyncio.iscoroutinefunction(handler))
+        )
+        return self._next_id()
 
     def publish(
         self, event_type: EventType, data: Any, source: str = "unknown"
@@ -96,21 +125,22 @@ class EventBus:
         event = Event(
             type=event_type,
             data=data,
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns(),
             source=source,
-            event_id=str(uuid4()),
+            event_id=self._next_id(),
         )
 
         self._add_to_history(event)
 
         # Notify synchronous subscribers
-        if event_type in self._subscribers:
-            for handler in self._subscribers[event_type]:
+        handlers = self._subscribers.get(event_type)
+        if handlers:
+            for handler in handlers:
                 try:
                     handler(event)
                 except Exception as e:
                     import logging
-                logging.getLogger(__name__).error(f"Error in event handler: {e}")
+                    logging.getLogger(__name__).error(f"Error in event handler: {e}")
 
     async def publish_async(
         self, event_type: EventType, data: Any, source: str = "unknown"
@@ -119,16 +149,17 @@ class EventBus:
         event = Event(
             type=event_type,
             data=data,
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns(),
             source=source,
-            event_id=str(uuid4()),
+            event_id=self._next_id(),
         )
 
         self._add_to_history(event)
 
         # Notify synchronous subscribers first
-        if event_type in self._subscribers:
-            for handler in self._subscribers[event_type]:
+        handlers = self._subscribers.get(event_type)
+        if handlers:
+            for handler in handlers:
                 try:
                     handler(event)
                 except Exception as e:
@@ -136,11 +167,12 @@ class EventBus:
                     logging.getLogger(__name__).error(f"Error in sync event handler: {e}")
 
         # Notify async subscribers
-        if event_type in self._async_subscribers:
+        async_handlers = self._async_subscribers.get(event_type)
+        if async_handlers:
             tasks = []
-            for handler in self._async_subscribers[event_type]:
+            for handler, is_coroutine in async_handlers:
                 try:
-                    if asyncio.iscoroutinefunction(handler):
+                    if is_coroutine:
                         tasks.append(handler(event))
                     else:
                         handler(event)
@@ -152,42 +184,38 @@ class EventBus:
                 await asyncio.gather(*tasks, return_exceptions=True)
 
     def _add_to_history(self, event: Event) -> None:
-        """Add event to history"""
-        self._event_history.append(event)
-
-        # Trim history if needed
-        if len(self._event_history) > self._max_history:
-            self._event_history = self._event_history[-self._max_history :]
+        """Add event to history (the deque drops the oldest event when full)"""
+        history = self._event_history
+        if len(history) == history.maxlen:
+            # The evicted event is also the oldest of its type
+            self._history_by_type[history[0].type].popleft()
+        history.append(event)
+        self._history_by_type[event.type].append(event)
 
     def get_event_history(
         self, event_type: Optional[EventType] = None, limit: int = 100
     ) -> List[Event]:
         """Get event history"""
-        events = self._event_history
-
         if event_type:
-            events = [e for e in events if e.type == event_type]
+            events = list(self._history_by_type.get(event_type, ()))
+        else:
+            events = list(self._event_history)
 
         return events[-limit:]
 
     def clear_history(self) -> None:
         """Clear event history"""
         self._event_history.clear()
+        self._history_by_type.clear()
 
 
-# Global event bus instance
-_event_bus: Optional[EventBus] = None
-
-
+# Global event bus instance, created on first use
+@functools.lru_cache(maxsize=None)
 def get_event_bus() -> EventBus:
     """Get the global event bus instance"""
-    global _event_bus
-    if _event_bus is None:
-        _event_bus = EventBus()
-    return _event_bus
+    return EventBus()
 
 
 def reset_event_bus() -> None:
     """Reset the global event bus (useful for testing)"""
-    global _event_bus
-    _event_bus = None
+    get_event_bus.cache_clear()
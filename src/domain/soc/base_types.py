@@ -2,10 +2,14 @@
 Base types and data classes for SOC specifications
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List
 
+# Slotted dataclass instances where supported (3.10+); shared by the SOC modules
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class SOCFamily(Enum):
     """Supported SOC families"""
@@ -27,7 +31,7 @@ class ArchitectureType(Enum):
     X86 = "i386"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PerformanceProfile:
     """Performance characteristics of a SOC"""
 
@@ -44,7 +48,7 @@ class PerformanceProfile:
     thermal_design_power: int = 0  # TDP in watts
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ConnectivityProfile:
     """Connectivity capabilities of a SOC"""
 
@@ -56,9 +60,19 @@ class ConnectivityProfile:
     max_resolution: str = "1080p"
     display_outputs: int = 1
     audio_outputs: List[str] = field(default_factory=list)
+    # Capability flags derived once from the fields above
+    has_bt5: bool = field(init=False, repr=False, compare=False)
+    has_wifi_ac: bool = field(init=False, repr=False, compare=False)
+    is_4k_capable: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, "has_bt5", self.bluetooth_version.startswith("5"))
+        object.__setattr__(self, "has_wifi_ac", "802.11ac" in self.wifi_standards)
+        object.__setattr__(self, "is_4k_capable", "4K" in self.max_resolution)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IOProfile:
     """Input/Output capabilities"""
 
@@ -76,7 +90,7 @@ class IOProfile:
     sata_support: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PowerProfile:
     """Power management capabilities"""
 
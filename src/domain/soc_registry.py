@@ -3,85 +3,177 @@ SOC Registry for easy extensibility and platform support
 This file provides a centralized registry for adding new SOC support
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Type
-
-from .soc_specifications import (
-    AllwinnerDetector,
-    BroadcomDetector,
-    MediaTekDetector,
-    QualcommDetector,
-    RockchipDetector,
-    SOCDetector,
-    SOCFamily,
-    SOCSpecification,
-)
-
-
-@dataclass
+import importlib
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+from .soc.base_types import _SLOTS
+from .soc_specifications import SOCFamily, SOCSpecification
+
+if TYPE_CHECKING:
+    from .soc_specifications import SOCDetector
+
+
+def _lazy_detector(class_name: str) -> Callable[[], Type["SOCDetector"]]:
+    """Factory importing a detector class from soc_specifications on first use"""
+
+    def load() -> Type["SOCDetector"]:
+        module = importlib.import_module(".soc_specifications", __package__)
+        return getattr(module, class_name)
+
+    return load
+
+
+@dataclass(frozen=True, init=False, **_SLOTS)
 class SOCRegistryEntry:
     """Registry entry for a SOC family"""
 
     family: SOCFamily
-    detector_class: Type[SOCDetector]
     description: str
     manufacturer: str
     common_boards: List[str]
+    # Resolved detector class, or None until _detector_factory has been called
+    _detector_class: Optional[Type["SOCDetector"]] = field(repr=False, compare=False)
+    _detector_factory: Optional[Callable[[], Type["SOCDetector"]]] = field(
+        repr=False, compare=False
+    )
+
+    def __init__(
+        self,
+        family: SOCFamily,
+        detector_class: Type["SOCDetector"],
+        description: str,
+        manufacturer: str,
+        common_boards: List[str],
+    ):
+        self._set_fields(family, description, manufacturer, common_boards)
+        object.__setattr__(self, "_detector_class", detector_class)
+        object.__setattr__(self, "_detector_factory", None)
+
+    @classmethod
+    def lazy(
+        cls,
+        family: SOCFamily,
+        detector_factory: Callable[[], Type["SOCDetector"]],
+        description: str,
+        manufacturer: str,
+        common_boards: List[str],
+    ) -> "SOCRegistryEntry":
+        """Entry whose detector class is only imported when first needed"""
+        entry = cls.__new__(cls)
+        entry._set_fields(family, description, manufacturer, common_boards)
+        object.__setattr__(entry, "_detector_class", None)
+        object.__setattr__(entry, "_detector_factory", detector_factory)
+        return entry
+
+    def _set_fields(
+        self,
+        family: SOCFamily,
+        description: str,
+        manufacturer: str,
+        common_boards: List[str],
+    ) -> None:
+        """Set the public fields (the dataclass is frozen)"""
+        object.__setattr__(self, "family", family)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "manufacturer", manufacturer)
+        object.__setattr__(self, "common_boards", common_boards)
+
+    def get_detector_class(self) -> Type["SOCDetector"]:
+        """Resolve the detector class, importing it on first use"""
+        if self._detector_class is None:
+            object.__setattr__(self, "_detector_class", self._detector_factory())
+        return self._detector_class
+
+    @property
+    def detector_class(self) -> Type["SOCDetector"]:
+        """Detector class for this family (resolved lazily)"""
+        return self.get_detector_class()
 
 
 class SOCRegistry:
     """Central registry for SOC families and their detectors"""
 
-    # Registry of supported SOC families
-    REGISTERED_FAMILIES: Dict[SOCFamily, SOCRegistryEntry] = {
-        SOCFamily.ROCKCHIP: SOCRegistryEntry(
+    # Registry of supported SOC families; modify only through register_family
+    _families: Dict[SOCFamily, SOCRegistryEntry] = {
+        SOCFamily.ROCKCHIP: SOCRegistryEntry.lazy(
             family=SOCFamily.ROCKCHIP,
-            detector_class=RockchipDetector,
+            detector_factory=_lazy_detector("RockchipDetector"),
             description="Rockchip ARM processors (RK3399, OP1, RK3588)",
             manufacturer="Rockchip",
             common_boards=["ROCK Pi 4", "ROCK Pi 4B+", "ROCK Pi 5", "NanoPi M4"],
         ),
-        SOCFamily.BROADCOM: SOCRegistryEntry(
+        SOCFamily.BROADCOM: SOCRegistryEntry.lazy(
             family=SOCFamily.BROADCOM,
-            detector_class=BroadcomDetector,
+            detector_factory=_lazy_detector("BroadcomDetector"),
             description="Broadcom ARM processors (BCM2835, BCM2711, BCM2712)",
             manufacturer="Broadcom",
             common_boards=["Raspberry Pi 1", "Raspberry Pi 4", "Raspberry Pi 5"],
         ),
-        SOCFamily.ALLWINNER: SOCRegistryEntry(
+        SOCFamily.ALLWINNER: SOCRegistryEntry.lazy(
             family=SOCFamily.ALLWINNER,
-            detector_class=AllwinnerDetector,
+            detector_factory=_lazy_detector("AllwinnerDetector"),
             description="Allwinner ARM processors (H6, H616, H618, A64)",
             manufacturer="Allwinner",
             common_boards=["Orange Pi 3", "Orange Pi 5", "Orange Pi Zero 2", "Pine64"],
         ),
-        SOCFamily.MEDIATEK: SOCRegistryEntry(
+        SOCFamily.MEDIATEK: SOCRegistryEntry.lazy(
             family=SOCFamily.MEDIATEK,
-            detector_class=MediaTekDetector,
+            detector_factory=_lazy_detector("MediaTekDetector"),
             description="MediaTek ARM processors (MT8183, MT8395)",
             manufacturer="MediaTek",
             common_boards=["Kompanio boards", "AIoT platforms"],
         ),
-        SOCFamily.QUALCOMM: SOCRegistryEntry(
+        SOCFamily.QUALCOMM: SOCRegistryEntry.lazy(
             family=SOCFamily.QUALCOMM,
-            detector_class=QualcommDetector,
+            detector_factory=_lazy_detector("QualcommDetector"),
             description="Qualcomm ARM processors (QCS605)",
             manufacturer="Qualcomm",
             common_boards=["Qualcomm development boards", "IoT platforms"],
         ),
     }
 
+    # Read-only view so external code cannot bypass cache invalidation
+    REGISTERED_FAMILIES: Mapping[SOCFamily, SOCRegistryEntry] = MappingProxyType(
+        _families
+    )
+    _families_tuple: Optional[Tuple[SOCFamily, ...]] = None
+
+    # Detector instances shared by all callers, rebuilt after the registry changes
+    _detector_cache: Optional[List["SOCDetector"]] = None
+
+    # Lowercased board names, rebuilt lazily after the registry changes
+    _board_index: Optional[Dict[str, SOCFamily]] = None
+    _board_names: Tuple[Tuple[str, SOCFamily], ...] = ()
+
     @classmethod
-    def get_all_families(cls) -> List[SOCFamily]:
+    def _build_board_index(cls) -> Dict[str, SOCFamily]:
+        """Index every registered board name (lowercased) by its family"""
+        cls._board_names = tuple(
+            (board.lower(), family)
+            for family, entry in cls.REGISTERED_FAMILIES.items()
+            for board in entry.common_boards
+        )
+        index: Dict[str, SOCFamily] = {}
+        for board, family in cls._board_names:
+            index.setdefault(board, family)
+        cls._board_index = index
+        return index
+
+    @classmethod
+    def get_all_families(cls) -> Tuple[SOCFamily, ...]:
         """Get all registered SOC families"""
-        return list(cls.REGISTERED_FAMILIES.keys())
+        if cls._families_tuple is None:
+            cls._families_tuple = tuple(cls.REGISTERED_FAMILIES)
+        return cls._families_tuple
 
     @classmethod
-    def get_detector_class(cls, family: SOCFamily) -> Type[SOCDetector]:
+    def get_detector_class(cls, family: SOCFamily) -> Type["SOCDetector"]:
         """Get detector class for a SOC family"""
         entry = cls.REGISTERED_FAMILIES.get(family)
         if entry:
-            return entry.detector_class
+            return entry.get_detector_class()
         raise ValueError(f"Unknown SOC family: {family}")
 
     @classmethod
@@ -95,38 +187,54 @@ class SOCRegistry:
     @classmethod
     def register_family(cls, entry: SOCRegistryEntry) -> None:
         """Register a new SOC family"""
-        cls.REGISTERED_FAMILIES[entry.family] = entry
+        cls._families[entry.family] = entry
+        cls._families_tuple = None
+        cls._board_index = None
+        cls._detector_cache = None
 
     @classmethod
-    def create_all_detectors(cls) -> List[SOCDetector]:
-        """Create instances of all registered detectors"""
+    def create_all_detectors(cls) -> List["SOCDetector"]:
+        """Get instances of all registered detectors (created once, then reused)"""
+        if cls._detector_cache is not None:
+            return list(cls._detector_cache)
+
         detectors = []
         for entry in cls.REGISTERED_FAMILIES.values():
             try:
-                detector = entry.detector_class()
+                detector = entry.get_detector_class()()
                 detectors.append(detector)
             except Exception as e:
                 print(
                     f"Warning: Failed to create detector for {entry.family.value}: {e}"
                 )
-        return detectors
+        cls._detector_cache = detectors
+        return list(detectors)
 
     @classmethod
-    def get_supported_boards(cls) -> Dict[str, List[str]]:
+    def get_supported_boards(cls) -> Dict[str, Tuple[str, ...]]:
         """Get all supported boards by family"""
-        boards = {}
-        for family, entry in cls.REGISTERED_FAMILIES.items():
-            boards[family.value] = entry.common_boards
-        return boards
+        # Tuples so callers cannot mutate the registry's board lists
+        return {
+            family.value: tuple(entry.common_boards)
+            for family, entry in cls.REGISTERED_FAMILIES.items()
+        }
 
     @classmethod
     def find_family_by_board(cls, board_name: str) -> SOCFamily:
         """Find SOC family by board name"""
+        index = cls._board_index
+        if index is None:
+            index = cls._build_board_index()
+
         board_lower = board_name.lower()
-        for family, entry in cls.REGISTERED_FAMILIES.items():
-            for board in entry.common_boards:
-                if board.lower() in board_lower or board_lower in board.lower():
-                    return family
+        family = index.get(board_lower)
+        if family is not None:
+            return family
+
+        # No exact name hit: fall back to substring matching either way round
+        for board, family in cls._board_names:
+            if board in board_lower or board_lower in board:
+                return family
         return SOCFamily.UNKNOWN
 
 
@@ -136,7 +244,7 @@ soc_registry = SOCRegistry()
 
 def register_custom_soc_family(
     family: SOCFamily,
-    detector_class: Type[SOCDetector],
+    detector_class: Type["SOCDetector"],
     description: str,
     manufacturer: str,
     common_boards: List[str],
@@ -5,24 +5,37 @@ This file provides backwards compatibility by re-exporting from the soc module
 
 # Import from the refactored module
 from .soc.base_types import (
-    SOCFamily, 
-    ArchitectureType, 
-    PerformanceProfile, 
-    ConnectivityProfile, 
-    IOProfile, 
-    PowerProfile
+    _SLOTS,
+    SOCFamily,
+    ArchitectureType,
+    PerformanceProfile,
+    ConnectivityProfile,
+    IOProfile,
+    PowerProfile,
 )
 
 # For now, maintain a simple specification class until full refactor
+import functools
+import os
+import platform
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Pattern, Tuple
 
+# A combined regex, the spec index for each of its capture groups, and a
+# cheap prefilter regex that must match before the combined one can
+_Matcher = Tuple[Pattern[str], Tuple[int, ...], Pattern[str]]
 
-@dataclass
+# Length of the pattern prefixes used as prefilter sentinels
+_SENTINEL_LENGTH = 3
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SOCSpecification:
     """Complete SOC specification"""
-    
+
     name: str
     family: SOCFamily
     architecture: ArchitectureType
@@ -32,152 +45,352 @@ class SOCSpecification:
     power_management: PowerProfile
     detection_patterns: List[str]
     device_tree_compatible: List[str]
-    
-    def matches_hardware(self, hardware_info: Dict[str, Any]) -> bool:
+    # Lowercased copies of the match tables, built once per spec
+    _patterns_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _dt_compat_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(
+            self, "_patterns_lower", tuple(map(str.lower, self.detection_patterns))
+        )
+        object.__setattr__(
+            self, "_dt_compat_lower", tuple(map(str.lower, self.device_tree_compatible))
+        )
+
+    def matches_hardware(self, hardware_info: Mapping[str, Any]) -> bool:
         """Check if this specification matches the detected hardware"""
         try:
             model = hardware_info.get("model", "").lower()
-            compatible = hardware_info.get("compatible", [])
-            
-            # Check device tree compatible strings
-            for compat in self.device_tree_compatible:
-                if any(compat in c for c in compatible):
-                    return True
-                    
-            # Check detection patterns
-            for pattern in self.detection_patterns:
-                if pattern.lower() in model:
-                    return True
-                    
-            return False
+            compatible = tuple(map(str.lower, hardware_info.get("compatible", ())))
         except (AttributeError, TypeError):
             return False
+        return self.matches_lowered(model, compatible)
+
+    def matches_lowered(self, model_lc: str, compatible_lc: Tuple[str, ...]) -> bool:
+        """Match against hardware strings that are already lowercased"""
+        # Check device tree compatible strings
+        for compat in self._dt_compat_lower:
+            if any(compat in c for c in compatible_lc):
+                return True
+
+        # Check detection patterns
+        for pattern in self._patterns_lower:
+            if pattern in model_lc:
+                return True
+
+        return False
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Built-in SOC specifications as read-only data; profiles are only built on first use
+_DEFAULT_SPEC_DATA: Tuple[Mapping[str, Any], ...] = _freeze(
+    (
+        {
+            "name": "Rock Pi 4B+ (OP1)",
+            "family": SOCFamily.ROCKCHIP,
+            "architecture": ArchitectureType.ARM64,
+            "performance": {
+                "cpu_cores": 6,
+                "cpu_big_cores": 2,
+                "cpu_little_cores": 4,
+                "cpu_big_max_freq_mhz": 2000,
+                "cpu_little_max_freq_mhz": 1500,
+                "memory_max_gb": 4,
+                "memory_type": "LPDDR4",
+            },
+            "connectivity": {
+                "wifi_standards": ["802.11ac"],
+                "bluetooth_version": "5.0",
+                "ethernet_speeds": ["1000"],
+                "hdmi_version": "2.0",
+                "max_resolution": "4K@60Hz",
+            },
+            "io_capabilities": {
+                "gpio_pins": 40,
+                "emmc_support": True,
+                "sd_card_support": True,
+                "nvme_support": True,
+            },
+            "power_management": {
+                "poe_support": True,
+                "power_states": ["active", "idle", "suspend"],
+            },
+            "detection_patterns": ["rock-pi-4b-plus", "op1"],
+            "device_tree_compatible": ["rockchip,rock-pi-4b-plus", "rockchip,op1"],
+        },
+        {
+            "name": "Rock Pi 4 (RK3399)",
+            "family": SOCFamily.ROCKCHIP,
+            "architecture": ArchitectureType.ARM64,
+            "performance": {
+                "cpu_cores": 6,
+                "cpu_big_cores": 2,
+                "cpu_little_cores": 4,
+                "cpu_big_max_freq_mhz": 1800,
+                "cpu_little_max_freq_mhz": 1400,
+                "memory_max_gb": 4,
+                "memory_type": "LPDDR4",
+            },
+            "connectivity": {
+                "wifi_standards": ["802.11ac"],
+                "bluetooth_version": "4.2",
+                "ethernet_speeds": ["1000"],
+                "hdmi_version": "2.0",
+                "max_resolution": "4K@30Hz",
+            },
+            "io_capabilities": {
+                "gpio_pins": 40,
+                "emmc_support": True,
+                "sd_card_support": True,
+            },
+            "power_management": {
+                "power_states": ["active", "idle", "suspend"],
+            },
+            "detection_patterns": ["rock-pi-4", "rk3399"],
+            "device_tree_compatible": ["rockchip,rock-pi-4", "rockchip,rk3399"],
+        },
+    )
+)
+
+
+# Profiles for table entries that leave a section out; frozen, so one instance is shared
+_EMPTY_CONNECTIVITY = ConnectivityProfile()
+_EMPTY_IO_PROFILE = IOProfile()
+_EMPTY_POWER_PROFILE = PowerProfile()
+
+
+def _build_profile(
+    profile_type: Any, section: Optional[Mapping[str, Any]], empty: Any = None
+) -> Any:
+    """Build a profile from a table section, with frozen sequences back as lists"""
+    if section is None:
+        return empty
+    return profile_type(
+        **{
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in section.items()
+        }
+    )
+
+
+def _build_specification(data: Mapping[str, Any]) -> SOCSpecification:
+    """Build a SOC specification from its data table entry"""
+    return SOCSpecification(
+        name=data["name"],
+        family=data["family"],
+        architecture=data["architecture"],
+        performance=_build_profile(PerformanceProfile, data["performance"]),
+        connectivity=_build_profile(
+            ConnectivityProfile, data.get("connectivity"), _EMPTY_CONNECTIVITY
+        ),
+        io_capabilities=_build_profile(
+            IOProfile, data.get("io_capabilities"), _EMPTY_IO_PROFILE
+        ),
+        power_management=_build_profile(
+            PowerProfile, data.get("power_management"), _EMPTY_POWER_PROFILE
+        ),
+        detection_patterns=list(data["detection_patterns"]),
+        device_tree_compatible=list(data["device_tree_compatible"]),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _default_specifications() -> Tuple[SOCSpecification, ...]:
+    """Build the built-in specs once; they are frozen, so every manager shares them"""
+    return tuple(_build_specification(data) for data in _DEFAULT_SPEC_DATA)
 
 
 # Simple SOC Manager for backwards compatibility
 class SOCManager:
     """Simplified SOC manager for hardware detection and configuration"""
-    
+
     def __init__(self):
-        self._specifications: List[SOCSpecification] = []
-        self._register_default_specs()
-    
-    def _register_default_specs(self):
-        """Register default SOC specifications"""
-        # Rock Pi 4B+ (OP1)
-        self.register_specification(SOCSpecification(
-            name="Rock Pi 4B+ (OP1)",
-            family=SOCFamily.ROCKCHIP,
-            architecture=ArchitectureType.ARM64,
-            performance=PerformanceProfile(
-                cpu_cores=6,
-                cpu_big_cores=2,
-                cpu_little_cores=4,
-                cpu_big_max_freq_mhz=2000,
-                cpu_little_max_freq_mhz=1500,
-                memory_max_gb=4,
-                memory_type="LPDDR4"
-            ),
-            connectivity=ConnectivityProfile(
-                wifi_standards=["802.11ac"],
-                bluetooth_version="5.0",
-                ethernet_speeds=["1000"],
-                hdmi_version="2.0",
-                max_resolution="4K@60Hz"
-            ),
-            io_capabilities=IOProfile(
-                gpio_pins=40,
-                emmc_support=True,
-                sd_card_support=True,
-                nvme_support=True
-            ),
-            power_management=PowerProfile(
-                poe_support=True,
-                power_states=["active", "idle", "suspend"]
-            ),
-            detection_patterns=["rock-pi-4b-plus", "op1"],
-            device_tree_compatible=["rockchip,rock-pi-4b-plus", "rockchip,op1"]
-        ))
-        
-        # Rock Pi 4 (RK3399)
-        self.register_specification(SOCSpecification(
-            name="Rock Pi 4 (RK3399)",
-            family=SOCFamily.ROCKCHIP,
-            architecture=ArchitectureType.ARM64,
-            performance=PerformanceProfile(
-                cpu_cores=6,
-                cpu_big_cores=2,
-                cpu_little_cores=4,
-                cpu_big_max_freq_mhz=1800,
-                cpu_little_max_freq_mhz=1400,
-                memory_max_gb=4,
-                memory_type="LPDDR4"
-            ),
-            connectivity=ConnectivityProfile(
-                wifi_standards=["802.11ac"],
-                bluetooth_version="4.2",
-                ethernet_speeds=["1000"],
-                hdmi_version="2.0",
-                max_resolution="4K@30Hz"
-            ),
-            io_capabilities=IOProfile(
-                gpio_pins=40,
-                emmc_support=True,
-                sd_card_support=True
-            ),
-            power_management=PowerProfile(
-                power_states=["active", "idle", "suspend"]
-            ),
-            detection_patterns=["rock-pi-4", "rk3399"],
-            device_tree_compatible=["rockchip,rock-pi-4", "rockchip,rk3399"]
-        ))
-    
+        self._specs: Optional[List[SOCSpecification]] = None
+        # Last detection result and the (model, compatible) key it was computed for
+        self._detected: Optional[SOCSpecification] = None
+        self._detected_key: Optional[Tuple[Any, Tuple[Any, ...]]] = None
+        # Combined (model, compatible) matchers over all specs, built on first detection
+        self._matchers: Optional[Tuple[Optional[_Matcher], Optional[_Matcher]]] = None
+        # Lowercased name/alias -> spec, built on first name lookup
+        self._name_index: Optional[Dict[str, SOCSpecification]] = None
+
+    @property
+    def _specifications(self) -> List[SOCSpecification]:
+        """Registered specs; the built-in ones are loaded on first access"""
+        if self._specs is None:
+            self._specs = list(_default_specifications())
+        return self._specs
+
     def register_specification(self, spec: SOCSpecification):
         """Register a new SOC specification"""
         self._specifications.append(spec)
-    
-    def detect_soc(self, hardware_info: Optional[Dict[str, Any]] = None) -> Optional[SOCSpecification]:
+        self.invalidate()
+
+    def get_all_supported_socs(self) -> List[SOCSpecification]:
+        """Get every registered SOC specification, in registration order"""
+        return list(self._specifications)
+
+    def get_soc_by_name(self, name: str) -> Optional[SOCSpecification]:
+        """Get a registered SOC spec by name or detection alias (case-insensitive)"""
+        if self._name_index is None:
+            self._name_index = self._build_name_index()
+        return self._name_index.get(name.lower())
+
+    def _build_name_index(self) -> Dict[str, SOCSpecification]:
+        """Index specs by lowercased name, then by detection pattern as an alias"""
+        specs = self._specifications
+        index = {spec.name.lower(): spec for spec in reversed(specs)}
+        # Aliases never shadow a name; the earliest-registered spec wins a shared alias
+        for spec in specs:
+            for alias in spec._patterns_lower:
+                index.setdefault(alias, spec)
+        return index
+
+    def invalidate(self) -> None:
+        """Forget the cached detection result and compiled matchers"""
+        self._detected = None
+        self._detected_key = None
+        self._matchers = None
+        self._name_index = None
+
+    def _build_matchers(self) -> Tuple[Optional[_Matcher], Optional[_Matcher]]:
+        """Compile all model patterns and compatible strings into one regex each"""
+        specs = self._specifications
+        return (
+            _compile_matcher(tuple(spec._patterns_lower for spec in specs)),
+            _compile_matcher(tuple(spec._dt_compat_lower for spec in specs)),
+        )
+
+    def detect_soc(
+        self, hardware_info: Optional[Mapping[str, Any]] = None
+    ) -> Optional[SOCSpecification]:
         """Detect SOC based on hardware information"""
         if not hardware_info:
             hardware_info = self._get_hardware_info()
-        
-        for spec in self._specifications:
-            if spec.matches_hardware(hardware_info):
-                return spec
-        
-        return None
-    
-    def _get_hardware_info(self) -> Dict[str, Any]:
-        """Get hardware information from system"""
+
         try:
-            import os
-            import platform
-            
-            info = {
-                "model": platform.machine(),
-                "compatible": [],
-                "processor": platform.processor()
-            }
-            
-            # Try to read device tree compatible
-            try:
-                with open("/proc/device-tree/compatible", "r") as f:
-                    compatible_str = f.read().strip("\x00")
-                    info["compatible"] = compatible_str.split("\x00")
-            except (FileNotFoundError, PermissionError):
-                pass
-                
-            # Try to read model
-            try:
-                with open("/proc/device-tree/model", "r") as f:
-                    info["model"] = f.read().strip("\x00")
-            except (FileNotFoundError, PermissionError):
-                pass
-                
-            return info
-            
-        except ImportError:
-            return {"model": "unknown", "compatible": [], "processor": "unknown"}
+            key = (
+                hardware_info.get("model"),
+                tuple(hardware_info.get("compatible") or ()),
+            )
+            if key == self._detected_key:
+                return self._detected
+
+            # Lowercase the hardware strings once rather than once per spec
+            model_lc = (key[0] or "").lower()
+            compatible_lc = tuple(map(str.lower, key[1]))
+        except (AttributeError, TypeError):
+            # Malformed hardware info matches nothing
+            return None
+
+        if self._matchers is None:
+            self._matchers = self._build_matchers()
+        model_matcher, compatible_matcher = self._matchers
+
+        # Lowest matching spec index across both hardware strings; compatible
+        # entries are NUL-joined so no pattern can match across two of them
+        # spec_for_group[1] is the lowest index a matcher can produce, so a scan
+        # stops once it is reached and is skipped if it cannot beat the best so far
+        best: Optional[int] = None
+        for matcher, text in (
+            (compatible_matcher, "\x00".join(compatible_lc)),
+            (model_matcher, model_lc),
+        ):
+            if matcher is None:
+                continue
+            regex, spec_for_group, sentinel = matcher
+            floor = spec_for_group[1]
+            if best is not None and best <= floor:
+                continue
+            if sentinel.search(text) is None:
+                continue
+            for match in regex.finditer(text):
+                index = spec_for_group[match.lastindex]
+                if best is None or index < best:
+                    best = index
+                    if index == floor:
+                        break
+
+        detected = self._specifications[best] if best is not None else None
+        self._detected, self._detected_key = detected, key
+        return detected
+
+    def get_hardware_info(self) -> Mapping[str, Any]:
+        """Get hardware information from system (read once per process)"""
+        return _read_hardware_info()
+
+    _get_hardware_info = get_hardware_info
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_matcher(tables: Tuple[Tuple[str, ...], ...]) -> Optional[_Matcher]:
+    """Compile per-spec match tables into one regex, once per distinct set of tables"""
+    # One capture group per spec, in registration order, inside a lookahead
+    # so every position is tried and the earliest-registered spec wins.
+    # spec_for_group maps match.lastindex straight back to the spec index.
+    spec_for_group: List[int] = [-1]
+    groups: List[str] = []
+    for index, table in enumerate(tables):
+        if table:
+            spec_for_group.append(index)
+            groups.append(f"({'|'.join(map(re.escape, table))})")
+    if not groups:
+        return None
+    # Every match starts with one of these prefixes; a plain literal alternation
+    # gets sre's first-character scan, unlike the lookahead-wrapped regex
+    sentinels = sorted(
+        {pattern[:_SENTINEL_LENGTH] for table in tables for pattern in table}
+    )
+    return (
+        re.compile(f"(?=(?:{'|'.join(groups)}))"),
+        tuple(spec_for_group),
+        re.compile("|".join(map(re.escape, sentinels))),
+    )
+
+
+_DEVICE_TREE_ROOT = "/proc/device-tree/"
+
+
+def _read_dt_node(name: str) -> str:
+    """Read a small device tree property with a single unbuffered read"""
+    fd = os.open(_DEVICE_TREE_ROOT + name, os.O_RDONLY)
+    try:
+        data = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8", "replace").strip("\x00")
+
+
+@functools.lru_cache(maxsize=1)
+def _read_hardware_info() -> Mapping[str, Any]:
+    """Read hardware identity once; it cannot change while the process runs"""
+    info: Dict[str, Any] = {
+        "model": platform.machine(),
+        "compatible": (),
+        "processor": platform.processor(),
+    }
+
+    # Device tree identity (absent on non-DT platforms such as x86); each
+    # node is read on its own so a missing one doesn't hide the other
+    try:
+        info["compatible"] = tuple(_read_dt_node("compatible").split("\x00"))
+    except OSError:
+        pass
+    try:
+        info["model"] = _read_dt_node("model")
+    except OSError:
+        pass
+
+    return MappingProxyType(info)
 
 
 # Create global instance for backwards compatibility
@@ -186,12 +399,12 @@ soc_manager = SOCManager()
 # Re-export for backwards compatibility
 __all__ = [
     "SOCFamily",
-    "ArchitectureType", 
+    "ArchitectureType",
     "PerformanceProfile",
     "ConnectivityProfile",
     "IOProfile",
     "PowerProfile",
     "SOCSpecification",
     "SOCManager",
-    "soc_manager"
+    "soc_manager",
 ]
@@ -9,6 +9,13 @@ from typing import Generic, List, TypeVar, Union
 
 T = TypeVar("T")
 
+# Standard MAC address format (XX:XX:XX:XX:XX:XX), compiled once at import
+_MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
+
+# Common weak passwords (compared lowercased) and sequential PINs
+_WEAK_PASSWORDS = frozenset({"password", "12345678", "admin123", "password123"})
+_WEAK_PINS = frozenset({"1234", "4321", "0123", "3210"})
+
 
 class ISpecification(ABC, Generic[T]):
     """Interface for specifications"""
@@ -76,8 +83,8 @@ class ValidSSIDSpecification(ISpecification[str]):
             return False
         if len(ssid) > 32 or len(ssid) < 1:
             return False
-        # Check for invalid characters
-        return not re.search(r"[^\x20-\x7E]", ssid)
+        # Only printable ASCII (0x20-0x7E) is allowed
+        return ssid.isascii() and ssid.isprintable()
 
 
 class StrongPasswordSpecification(ISpecification[str]):
@@ -90,8 +97,7 @@ class StrongPasswordSpecification(ISpecification[str]):
             return False
 
         # Check for common weak passwords
-        weak_passwords = ["password", "12345678", "admin123", "password123"]
-        if password.lower() in weak_passwords:
+        if password.lower() in _WEAK_PASSWORDS:
             return False
 
         return True
@@ -187,7 +193,7 @@ class DevicePinSpecification(ISpecification[str]):
             return False
 
         # Sequential patterns
-        if pin in ["1234", "4321", "0123", "3210"]:
+        if pin in _WEAK_PINS:
             return False
 
         return True
@@ -200,15 +206,15 @@ class ValidIPAddressSpecification(ISpecification[str]):
         if not ip:
             return False
 
-        # Basic IPv4 validation
-        ip_pattern = r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
-        match = re.match(ip_pattern, ip)
-
-        if not match:
+        # Basic IPv4 validation: four dot-separated decimal octets
+        octets = ip.split(".")
+        if len(octets) != 4:
             return False
 
-        # Check each octet is in valid range
-        for octet in match.groups():
+        # Check each octet is 1-3 ASCII digits in valid range
+        for octet in octets:
+            if not (octet.isascii() and octet.isdigit()) or len(octet) > 3:
+                return False
             if int(octet) > 255:
                 return False
 
@@ -222,9 +228,7 @@ class ValidMacAddressSpecification(ISpecification[str]):
         if not mac:
             return False
 
-        # Standard MAC address format (XX:XX:XX:XX:XX:XX)
-        mac_pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-        return bool(re.match(mac_pattern, mac))
+        return bool(_MAC_RE.match(mac))
 
 
 # Factory for creating specifications
@@ -265,26 +269,27 @@ class SpecificationBasedValidationService:
 
     def __init__(self):
         self.factory = SpecificationFactory()
+        # Specifications are stateless, so one instance of each serves every call
+        self._network_credentials_spec = self.factory.create_network_credentials_spec()
+        self._device_pin_spec = self.factory.create_device_pin_spec()
+        self._ip_address_spec = self.factory.create_ip_address_spec()
+        self._mac_address_spec = self.factory.create_mac_address_spec()
 
     def validate_network_credentials(self, credentials: dict) -> bool:
         """Validate network credentials using specifications"""
-        spec = self.factory.create_network_credentials_spec()
-        return spec.is_satisfied_by(credentials)
+        return self._network_credentials_spec.is_satisfied_by(credentials)
 
     def validate_device_pin(self, pin: str) -> bool:
         """Validate device PIN using specifications"""
-        spec = self.factory.create_device_pin_spec()
-        return spec.is_satisfied_by(pin)
+        return self._device_pin_spec.is_satisfied_by(pin)
 
     def validate_ip_address(self, ip: str) -> bool:
         """Validate IP address using specifications"""
-        spec = self.factory.create_ip_address_spec()
-        return spec.is_satisfied_by(ip)
+        return self._ip_address_spec.is_satisfied_by(ip)
 
     def validate_mac_address(self, mac: str) -> bool:
         """Validate MAC address using specifications"""
-        spec = self.factory.create_mac_address_spec()
-        return spec.is_satisfied_by(mac)
+        return self._mac_address_spec.is_satisfied_by(mac)
 
     def create_custom_validation(
         self, *specifications: ISpecification[str]
@@ -9,6 +9,44 @@ from ..interfaces import ILogger, IValidationService
 from .errors import ErrorCode, ErrorSeverity, ValidationError
 
 
+# Injection patterns, authored in lowercase and matched against lowercased text
+_INJECTION_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        # SQL injection patterns
+        r"['\"`;]",  # SQL injection quotes and terminators
+        r"\b(union|select|insert|update|delete|drop|exec|alter|create)\b",  # SQL keywords
+        r"--\s*",  # SQL comments
+        r"/\*.*\*/",  # SQL block comments
+        r"\|\|",  # SQL concatenation
+        # Command injection patterns
+        r"[;&|`$()]",  # Shell metacharacters
+        r"\$\(",  # Command substitution
+        r"`.*`",  # Backtick command substitution
+        r"\\x[0-9a-f]{2}",  # Hex escape sequences
+        r"\$\{.*\}",  # Variable expansion
+        r"&&|\|\|",  # Command chaining
+        # LDAP injection patterns
+        r"[()&|!]",  # LDAP special characters
+        r"\*",  # LDAP wildcards
+        # XSS patterns (for completeness)
+        r"<script",  # Script tags
+        r"javascript:",  # JavaScript protocol
+        r"on\w+\s*=",  # Event handlers
+    )
+)
+
+# Network configuration injection patterns, matched against the lowercased SSID
+_NETWORK_CONFIG_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\n|\r",  # Line breaks that could break config files
+        r"\\[nr]",  # Escaped line breaks
+        r"#.*config",  # Configuration directives
+    )
+)
+
+
 class ValidationService(IValidationService):
     """Central validation service for all domain objects"""
 
@@ -71,13 +109,9 @@ class ValidationService(IValidationService):
                 errors.append("SSID contains potentially malicious patterns")
 
             # Check for network configuration injection patterns
-            network_patterns = [
-                r"\n|\r",  # Line breaks that could break config files
-                r"\\[nr]",  # Escaped line breaks
-                r"#.*config",  # Configuration directives
-            ]
-            for pattern in network_patterns:
-                if re.search(pattern, ssid, re.IGNORECASE):
+            ssid_lc = ssid.lower()
+            for pattern in _NETWORK_CONFIG_PATTERNS:
+                if pattern.search(ssid_lc):
                     errors.append(
                         "SSID contains network configuration injection patterns"
                     )
@@ -416,44 +450,13 @@ class ValidationService(IValidationService):
     def _contains_injection_patterns(self, text: str) -> bool:
         """Check for various injection attack patterns"""
         try:
-            # SQL injection patterns
-            sql_patterns = [
-                r"['\"`;]",  # SQL injection quotes and terminators
-                r"\b(union|select|insert|update|delete|drop|exec|alter|create)\b",  # SQL keywords
-                r"--\s*",  # SQL comments
-                r"/\*.*\*/",  # SQL block comments
-                r"\|\|",  # SQL concatenation
-            ]
-            
-            # Command injection patterns
-            command_patterns = [
-                r"[;&|`$()]",  # Shell metacharacters
-                r"\$\(",  # Command substitution
-                r"`.*`",  # Backtick command substitution
-                r"\\x[0-9a-fA-F]{2}",  # Hex escape sequences
-                r"\$\{.*\}",  # Variable expansion
-                r"&&|\|\|",  # Command chaining
-            ]
-            
-            # LDAP injection patterns
-            ldap_patterns = [
-                r"[()&|!]",  # LDAP special characters
-                r"\*",  # LDAP wildcards
-            ]
-            
-            # XSS patterns (for completeness)
-            xss_patterns = [
-                r"<script",  # Script tags
-                r"javascript:",  # JavaScript protocol
-                r"on\w+\s*=",  # Event handlers
-            ]
-            
-            all_patterns = sql_patterns + command_patterns + ldap_patterns + xss_patterns
-            
-            for pattern in all_patterns:
-                if re.search(pattern, text, re.IGNORECASE):
+            # Patterns are lowercase, so lowercasing the text once replaces
+            # re.IGNORECASE case folding on every comparison
+            text_lc = text.lower()
+            for pattern in _INJECTION_PATTERNS:
+                if pattern.search(text_lc):
                     if self.logger:
-                        self.logger.warning(f"Injection pattern detected: {pattern}")
+                        self.logger.warning(f"Injection pattern detected: {pattern.pattern}")
                     return True
                     
             return False
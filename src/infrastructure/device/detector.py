@@ -2,11 +2,15 @@
 Device hardware detection and SOC identification
 """
 
+import functools
+import os
+import re
 import subprocess
-from typing import Optional
+from typing import Optional, Tuple
 
 from ...common.result_handling import Result
 from ...domain.errors import ErrorCode, ErrorSeverity, SystemError
+
 try:
     from ...domain.soc_specifications import SOCSpecification, soc_manager
 except ImportError:
@@ -16,32 +20,91 @@ except ImportError:
 from ...interfaces import ILogger
 
 
+# "Revision : <code>" line of /proc/cpuinfo, found in one scan of the whole file
+_CPUINFO_REVISION_RE = re.compile(r"^Revision[^:\n]*:([^:\n]*)", re.MULTILINE)
+
+
+def read_small_file(path: str) -> str:
+    """Read a small /proc or /sys file with raw os.read calls, no buffered text IO"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        chunks = []
+        # Most identity files fit in one read; /proc/cpuinfo can span several
+        while True:
+            data = os.read(fd, 4096)
+            if not data:
+                break
+            chunks.append(data)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode("utf-8", "replace")
+
+
+@functools.lru_cache(maxsize=None)
+def _read_identity_file(path: str) -> Optional[str]:
+    """Read a hardware identity file once per process; None if it is absent"""
+    try:
+        return read_small_file(path)
+    except FileNotFoundError:
+        return None
+
+
+def invalidate_device_info_cache() -> None:
+    """Forget cached identity file contents, e.g. after faking the filesystem"""
+    _read_identity_file.cache_clear()
+
+
 class DeviceDetector:
     """Hardware detection and SOC identification service"""
 
     def __init__(self, logger: Optional[ILogger] = None):
         self.logger = logger
         self._soc_spec: Optional["SOCSpecification"] = None
+        self._soc_detected = False
 
     def get_soc_spec(self) -> Optional["SOCSpecification"]:
-        """Get SOC specification (cached)"""
-        if self._soc_spec is None and soc_manager is not None:
-            self._soc_spec = soc_manager.detect_soc()
+        """Get SOC specification (cached, including an unknown SOC)"""
+        if not self._soc_detected:
+            self._soc_spec = (
+                soc_manager.detect_soc() if soc_manager is not None else None
+            )
+            self._soc_detected = True
         return self._soc_spec
 
+    def invalidate_cache(self) -> None:
+        """Forget the cached SOC specification so the next lookup detects again"""
+        self._soc_spec = None
+        self._soc_detected = False
+
+    def _device_tree_compatible(self) -> Tuple[str, ...]:
+        """Device tree compatible strings, reusing the SOC manager's read if possible"""
+        if soc_manager is not None:
+            return tuple(soc_manager.get_hardware_info().get("compatible", ()))
+        compatible = _read_identity_file("/proc/device-tree/compatible")
+        return tuple(compatible.strip("\x00").split("\x00")) if compatible else ()
+
     def get_hardware_version(self) -> Result[str, Exception]:
         """Get hardware version with SOC-aware detection"""
         try:
             soc_spec = self.get_soc_spec()
-            
+
             # Try different methods based on SOC type
-            if soc_spec and hasattr(soc_spec, 'name') and soc_spec.name in ["OP1", "RK3399"]:
+            if (
+                soc_spec
+                and hasattr(soc_spec, "name")
+                and soc_spec.name in ["OP1", "RK3399"]
+            ):
                 return self._get_rockpi_hardware_version()
-            elif soc_spec and hasattr(soc_spec, 'family') and hasattr(soc_spec.family, 'value') and soc_spec.family.value == "broadcom":
+            elif (
+                soc_spec
+                and hasattr(soc_spec, "family")
+                and hasattr(soc_spec.family, "value")
+                and soc_spec.family.value == "broadcom"
+            ):
                 return self._get_raspberry_pi_hardware_version()
             else:
                 return self._get_generic_hardware_version()
-                
+
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Hardware version detection failed: {e}")
@@ -57,31 +120,24 @@ class DeviceDetector:
         """Get ROCK Pi specific hardware version"""
         try:
             # Try device tree compatible string first
-            try:
-                with open("/proc/device-tree/compatible", "r") as f:
-                    compatible = f.read().strip('\x00')
-                    if "rockchip,rk3399" in compatible:
-                        return Result.success("ROCK Pi 4B+")
-            except FileNotFoundError:
-                pass
+            if any(
+                "rockchip,rk3399" in entry for entry in self._device_tree_compatible()
+            ):
+                return Result.success("ROCK Pi 4B+")
 
             # Try board name from DMI
-            try:
-                with open("/sys/class/dmi/id/board_name", "r") as f:
-                    board_name = f.read().strip()
-                    if board_name:
-                        return Result.success(f"ROCK Pi {board_name}")
-            except FileNotFoundError:
-                pass
+            board_name = (
+                _read_identity_file("/sys/class/dmi/id/board_name") or ""
+            ).strip()
+            if board_name:
+                return Result.success(f"ROCK Pi {board_name}")
 
             # Try product name
-            try:
-                with open("/sys/class/dmi/id/product_name", "r") as f:
-                    product_name = f.read().strip()
-                    if product_name:
-                        return Result.success(product_name)
-            except FileNotFoundError:
-                pass
+            product_name = (
+                _read_identity_file("/sys/class/dmi/id/product_name") or ""
+            ).strip()
+            if product_name:
+                return Result.success(product_name)
 
             return Result.success("ROCK Pi 4 (Unknown variant)")
 
@@ -92,23 +148,16 @@ class DeviceDetector:
         """Get Raspberry Pi specific hardware version"""
         try:
             # Try CPU info for Pi revision
-            try:
-                with open("/proc/cpuinfo", "r") as f:
-                    for line in f:
-                        if line.startswith("Revision"):
-                            revision = line.split(":")[1].strip()
-                            return Result.success(f"Raspberry Pi (Rev: {revision})")
-            except FileNotFoundError:
-                pass
+            match = _CPUINFO_REVISION_RE.search(
+                _read_identity_file("/proc/cpuinfo") or ""
+            )
+            if match:
+                return Result.success(f"Raspberry Pi (Rev: {match.group(1).strip()})")
 
             # Try device tree model
-            try:
-                with open("/proc/device-tree/model", "r") as f:
-                    model = f.read().strip('\x00')
-                    if model:
-                        return Result.success(model)
-            except FileNotFoundError:
-                pass
+            model = (_read_identity_file("/proc/device-tree/model") or "").strip("\x00")
+            if model:
+                return Result.success(model)
 
             return Result.success("Raspberry Pi (Unknown model)")
 
@@ -122,17 +171,13 @@ class DeviceDetector:
             dmi_fields = [
                 "/sys/class/dmi/id/board_name",
                 "/sys/class/dmi/id/product_name",
-                "/sys/class/dmi/id/sys_vendor"
+                "/sys/class/dmi/id/sys_vendor",
             ]
 
             for field_path in dmi_fields:
-                try:
-                    with open(field_path, "r") as f:
-                        value = f.read().strip()
-                        if value and value not in ["To be filled by O.E.M.", "Default string"]:
-                            return Result.success(value)
-                except FileNotFoundError:
-                    continue
+                value = (_read_identity_file(field_path) or "").strip()
+                if value and value not in ["To be filled by O.E.M.", "Default string"]:
+                    return Result.success(value)
 
             # Try uname as fallback
             try:
@@ -154,14 +199,23 @@ class DeviceDetector:
         """Get firmware version with SOC-aware detection"""
         try:
             soc_spec = self.get_soc_spec()
-            
-            if soc_spec and hasattr(soc_spec, 'name') and soc_spec.name in ["OP1", "RK3399"]:
+
+            if (
+                soc_spec
+                and hasattr(soc_spec, "name")
+                and soc_spec.name in ["OP1", "RK3399"]
+            ):
                 return self._get_rockpi_firmware_version()
-            elif soc_spec and hasattr(soc_spec, 'family') and hasattr(soc_spec.family, 'value') and soc_spec.family.value == "broadcom":
+            elif (
+                soc_spec
+                and hasattr(soc_spec, "family")
+                and hasattr(soc_spec.family, "value")
+                and soc_spec.family.value == "broadcom"
+            ):
                 return self._get_raspberry_pi_firmware_version()
             else:
                 return self._get_generic_firmware_version()
-                
+
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Firmware version detection failed: {e}")
@@ -183,22 +237,20 @@ class DeviceDetector:
                     capture_output=True,
                     text=True,
                     timeout=5,
-                    shell=True
+                    shell=True,
                 )
                 if result.returncode == 0 and result.stdout:
-                    uboot_line = result.stdout.split('\n')[0]
+                    uboot_line = result.stdout.split("\n")[0]
                     return Result.success(f"U-Boot: {uboot_line}")
             except (subprocess.TimeoutExpired, subprocess.SubprocessError):
                 pass
 
             # Try BIOS version from DMI
-            try:
-                with open("/sys/class/dmi/id/bios_version", "r") as f:
-                    bios_version = f.read().strip()
-                    if bios_version:
-                        return Result.success(f"BIOS: {bios_version}")
-            except FileNotFoundError:
-                pass
+            bios_version = (
+                _read_identity_file("/sys/class/dmi/id/bios_version") or ""
+            ).strip()
+            if bios_version:
+                return Result.success(f"BIOS: {bios_version}")
 
             return Result.success("Unknown Firmware")
 
@@ -215,7 +267,11 @@ class DeviceDetector:
                 )
                 if result.returncode == 0:
                     return Result.success(result.stdout.strip())
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+            except (
+                subprocess.TimeoutExpired,
+                subprocess.SubprocessError,
+                FileNotFoundError,
+            ):
                 pass
 
             return Result.success("Unknown Pi Firmware")
@@ -227,13 +283,11 @@ class DeviceDetector:
         """Get generic firmware version"""
         try:
             # Try DMI BIOS information
-            try:
-                with open("/sys/class/dmi/id/bios_version", "r") as f:
-                    bios_version = f.read().strip()
-                    if bios_version:
-                        return Result.success(f"BIOS: {bios_version}")
-            except FileNotFoundError:
-                pass
+            bios_version = (
+                _read_identity_file("/sys/class/dmi/id/bios_version") or ""
+            ).strip()
+            if bios_version:
+                return Result.success(f"BIOS: {bios_version}")
 
             # Try kernel version as fallback
             try:
@@ -267,19 +321,23 @@ class DeviceDetector:
             if soc_spec:
                 # SOC-specific capabilities
                 if soc_spec.name in ["OP1", "RK3399"]:
-                    capabilities.update({
-                        "gpio": True,
-                        "4k_display": True,
-                        "hw_acceleration": True,
-                        "usb3": True,
-                        "pcie": True,
-                    })
+                    capabilities.update(
+                        {
+                            "gpio": True,
+                            "4k_display": True,
+                            "hw_acceleration": True,
+                            "usb3": True,
+                            "pcie": True,
+                        }
+                    )
                 elif soc_spec.family.value == "broadcom":
-                    capabilities.update({
-                        "gpio": True,
-                        "camera": True,
-                        "dsi_display": True,
-                    })
+                    capabilities.update(
+                        {
+                            "gpio": True,
+                            "camera": True,
+                            "dsi_display": True,
+                        }
+                    )
 
             return Result.success(capabilities)
 
@@ -292,4 +350,4 @@ class DeviceDetector:
                     error_code=ErrorCode.HARDWARE_ERROR,
                     severity=ErrorSeverity.LOW,
                 )
-            )
\ No newline at end of file
+            )
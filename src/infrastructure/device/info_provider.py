@@ -10,7 +10,7 @@ from typing import Optional
 from ...common.result_handling import Result
 from ...domain.errors import ErrorCode, ErrorSeverity, SystemError
 from ...interfaces import DeviceInfo, IDeviceInfoProvider, ILogger
-from .detector import DeviceDetector
+from .detector import DeviceDetector, read_small_file
 
 
 class DeviceInfoProvider(IDeviceInfoProvider):
@@ -175,20 +175,18 @@ class DeviceInfoProvider(IDeviceInfoProvider):
         try:
             # Try machine ID first (most reliable on Linux)
             try:
-                with open("/etc/machine-id", "r") as f:
-                    machine_id = f.read().strip()
-                    if machine_id:
-                        return machine_id[:12]  # Use first 12 chars for brevity
+                machine_id = read_small_file("/etc/machine-id").strip()
+                if machine_id:
+                    return machine_id[:12]  # Use first 12 chars for brevity
             except FileNotFoundError:
                 pass
 
             # Try DMI product UUID
             try:
-                with open("/sys/class/dmi/id/product_uuid", "r") as f:
-                    uuid_str = f.read().strip()
-                    if uuid_str and uuid_str != "00000000-0000-0000-0000-000000000000":
-                        # Convert UUID to shorter format
-                        return uuid_str.replace("-", "")[:12]
+                uuid_str = read_small_file("/sys/class/dmi/id/product_uuid").strip()
+                if uuid_str and uuid_str != "00000000-0000-0000-0000-000000000000":
+                    # Convert UUID to shorter format
+                    return uuid_str.replace("-", "")[:12]
             except FileNotFoundError:
                 pass
 
@@ -227,10 +225,9 @@ class DeviceInfoProvider(IDeviceInfoProvider):
             # Check priority interfaces first
             for interface in priority_interfaces:
                 try:
-                    with open(f"/sys/class/net/{interface}/address", "r") as f:
-                        mac = f.read().strip()
-                        if mac and mac != "00:00:00:00:00:00":
-                            return mac
+                    mac = read_small_file(f"/sys/class/net/{interface}/address").strip()
+                    if mac and mac != "00:00:00:00:00:00":
+                        return mac
                 except FileNotFoundError:
                     continue
 
@@ -241,10 +238,11 @@ class DeviceInfoProvider(IDeviceInfoProvider):
                 for interface in os.listdir("/sys/class/net/"):
                     if interface != "lo":  # Skip loopback
                         try:
-                            with open(f"/sys/class/net/{interface}/address", "r") as f:
-                                mac = f.read().strip()
-                                if mac and mac != "00:00:00:00:00:00":
-                                    return mac
+                            mac = read_small_file(
+                                f"/sys/class/net/{interface}/address"
+                            ).strip()
+                            if mac and mac != "00:00:00:00:00:00":
+                                return mac
                         except (FileNotFoundError, OSError):
                             continue
             except (FileNotFoundError, OSError):
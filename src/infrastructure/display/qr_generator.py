@@ -147,20 +147,16 @@ class QRCodeGenerator:
             if not modules:
                 return "QR generation failed"
 
-            lines = []
-            lines.append("+" + "-" * (len(modules[0]) * 2) + "+")
+            border = "+" + "-" * (len(modules[0]) * 2) + "+"
+            lines = [border]
             
+            # Full block for black modules, two spaces for white modules;
+            # each row is joined once rather than grown cell by cell
             for row in modules:
-                line = "|"
-                for module in row:
-                    if module:
-                        line += "██"  # Full block for black modules
-                    else:
-                        line += "  "  # Two spaces for white modules
-                line += "|"
-                lines.append(line)
+                cells = "".join(["██" if module else "  " for module in row])
+                lines.append("|" + cells + "|")
             
-            lines.append("+" + "-" * (len(modules[0]) * 2) + "+")
+            lines.append(border)
             
             return "\n".join(lines)
 
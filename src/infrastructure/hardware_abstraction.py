@@ -3,16 +3,39 @@ Hardware Abstraction Layer (HAL) for different SOC families
 Provides platform-specific implementations while maintaining a common interface
 """
 
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from ..common.result_handling import Result
 from ..domain.errors import ErrorCode, ErrorSeverity, SystemError
+from ..domain.soc.base_types import _SLOTS
 from ..domain.soc_specifications import SOCFamily, SOCSpecification
 
 
-@dataclass
+# Physical pin numbers on the common 40-pin header, shared read-only by every HAL
+_DEFAULT_GPIO_MAPPING: Mapping[str, int] = MappingProxyType(
+    {
+        "status_led_green": 7,
+        "status_led_red": 11,
+        "status_led_blue": 13,
+        "reset_button": 15,
+        "config_button": 16,
+        "i2c_sda": 3,
+        "i2c_scl": 5,
+        "spi_mosi": 19,
+        "spi_miso": 21,
+        "spi_sclk": 23,
+        "spi_ce0": 24,
+        "pwm0": 12,
+        "pwm1": 33,
+    }
+)
+
+
+@dataclass(**_SLOTS)
 class HardwareCapabilities:
     """Hardware capabilities detected at runtime"""
 
@@ -41,7 +64,7 @@ class IHardwareAbstractionLayer(ABC):
         pass
 
     @abstractmethod
-    def get_gpio_mapping(self) -> Dict[str, int]:
+    def get_gpio_mapping(self) -> Mapping[str, int]:
         """Get GPIO pin mapping for this platform"""
         pass
 
@@ -81,15 +104,19 @@ class IHardwareAbstractionLayer(ABC):
         pass
 
 
-class RockchipHAL(IHardwareAbstractionLayer):
-    """Hardware abstraction layer for Rockchip SOCs"""
+class _ProbingHAL(IHardwareAbstractionLayer):
+    """Capability probing and display info shared by the concrete HALs"""
+
+    # Platform name used in initialization errors, and the severity to report
+    PLATFORM_NAME = "generic"
+    INIT_FAILURE_SEVERITY = ErrorSeverity.HIGH
 
-    def __init__(self, soc_spec: SOCSpecification):
+    def __init__(self, soc_spec: Optional[SOCSpecification]):
         self.soc_spec = soc_spec
         self.capabilities = HardwareCapabilities()
 
     def initialize(self) -> Result[bool, Exception]:
-        """Initialize Rockchip HAL"""
+        """Probe the available hardware interfaces"""
         try:
             # Detect available hardware interfaces
             self.capabilities.gpio_available = self._check_gpio_available()
@@ -107,8 +134,8 @@ class RockchipHAL(IHardwareAbstractionLayer):
             return Result.failure(
                 SystemError(
                     ErrorCode.DEVICE_INFO_UNAVAILABLE,
-                    f"Failed to initialize Rockchip HAL: {e}",
-                    ErrorSeverity.HIGH,
+                    f"Failed to initialize {self.PLATFORM_NAME} HAL: {e}",
+                    self.INIT_FAILURE_SEVERITY,
                 )
             )
 
@@ -116,27 +143,45 @@ class RockchipHAL(IHardwareAbstractionLayer):
         """Get hardware capabilities"""
         return self.capabilities
 
-    def get_gpio_mapping(self) -> Dict[str, int]:
+    def get_display_info(self) -> Dict[str, Any]:
+        """Get display configuration from the SOC connectivity profile"""
+        return {
+            "hdmi_device": "/dev/dri/card0",
+            "max_resolution": self.soc_spec.connectivity.max_resolution,
+            "hdmi_version": self.soc_spec.connectivity.hdmi_version,
+            "display_outputs": self.soc_spec.connectivity.display_outputs,
+        }
+
+    def _check_gpio_available(self) -> bool:
+        """Check if GPIO is available"""
+        return os.path.exists("/sys/class/gpio")
+
+    def _check_pwm_available(self) -> bool:
+        """Check if PWM is available"""
+        return os.path.exists("/sys/class/pwm")
+
+    def _check_bluetooth_available(self) -> bool:
+        """Check if Bluetooth is available"""
+        return os.path.exists("/sys/class/bluetooth")
+
+    def _check_display_available(self) -> bool:
+        """Check if display is available"""
+        return os.path.exists("/dev/dri/card0")
+
+
+class RockchipHAL(_ProbingHAL):
+    """Hardware abstraction layer for Rockchip SOCs"""
+
+    PLATFORM_NAME = "Rockchip"
+
+    def get_gpio_mapping(self) -> Mapping[str, int]:
         """Get GPIO pin mapping for Rockchip boards"""
-        if self.soc_spec.gpio_mapping:
-            return self.soc_spec.gpio_mapping
+        gpio_mapping = getattr(self.soc_spec, "gpio_mapping", None)
+        if gpio_mapping:
+            return gpio_mapping
 
         # Default Rockchip GPIO mapping
-        return {
-            "status_led_green": 7,
-            "status_led_red": 11,
-            "status_led_blue": 13,
-            "reset_button": 15,
-            "config_button": 16,
-            "i2c_sda": 3,
-            "i2c_scl": 5,
-            "spi_mosi": 19,
-            "spi_miso": 21,
-            "spi_sclk": 23,
-            "spi_ce0": 24,
-            "pwm0": 12,
-            "pwm1": 33,
-        }
+        return _DEFAULT_GPIO_MAPPING
 
     def get_i2c_buses(self) -> List[int]:
         """Get available I2C buses for Rockchip"""
@@ -154,15 +199,6 @@ class RockchipHAL(IHardwareAbstractionLayer):
         """Get network interfaces for Rockchip"""
         return ["wlan0", "eth0"]
 
-    def get_display_info(self) -> Dict[str, Any]:
-        """Get display configuration for Rockchip"""
-        return {
-            "hdmi_device": "/dev/dri/card0",
-            "max_resolution": self.soc_spec.connectivity.max_resolution,
-            "hdmi_version": self.soc_spec.connectivity.hdmi_version,
-            "display_outputs": self.soc_spec.connectivity.display_outputs,
-        }
-
     def optimize_performance(self) -> Result[bool, Exception]:
         """Apply Rockchip-specific performance optimizations"""
         try:
@@ -198,122 +234,45 @@ class RockchipHAL(IHardwareAbstractionLayer):
             "/sys/class/thermal/thermal_zone1/temp",  # GPU
         ]
 
-    def _check_gpio_available(self) -> bool:
-        """Check if GPIO is available"""
-        import os
-
-        return os.path.exists("/sys/class/gpio")
-
     def _check_i2c_available(self) -> bool:
         """Check if I2C is available"""
-        import os
-
         return any(os.path.exists(f"/dev/i2c-{i}") for i in range(10))
 
     def _check_spi_available(self) -> bool:
         """Check if SPI is available"""
-        import os
-
         return any(os.path.exists(f"/dev/spidev{i}.0") for i in range(10))
 
-    def _check_pwm_available(self) -> bool:
-        """Check if PWM is available"""
-        import os
-
-        return os.path.exists("/sys/class/pwm")
-
     def _check_uart_available(self) -> bool:
         """Check if UART is available"""
-        import os
-
         return any(os.path.exists(f"/dev/ttyS{i}") for i in range(10))
 
-    def _check_bluetooth_available(self) -> bool:
-        """Check if Bluetooth is available"""
-        import os
-
-        return os.path.exists("/sys/class/bluetooth")
-
     def _check_wifi_available(self) -> bool:
         """Check if WiFi is available"""
-        import os
-
         return any(
             os.path.exists(f"/sys/class/net/{iface}/wireless")
             for iface in ["wlan0", "wlp3s0", "wlo1"]
         )
 
-    def _check_display_available(self) -> bool:
-        """Check if display is available"""
-        import os
-
-        return os.path.exists("/dev/dri/card0")
-
     def _check_audio_available(self) -> bool:
         """Check if audio is available"""
-        import os
-
         return os.path.exists("/dev/snd") or any(
             os.path.exists(f"/proc/asound/card{i}") for i in range(5)
         )
 
 
-class BroadcomHAL(IHardwareAbstractionLayer):
+class BroadcomHAL(_ProbingHAL):
     """Hardware abstraction layer for Broadcom SOCs (Raspberry Pi)"""
 
-    def __init__(self, soc_spec: SOCSpecification):
-        self.soc_spec = soc_spec
-        self.capabilities = HardwareCapabilities()
-
-    def initialize(self) -> Result[bool, Exception]:
-        """Initialize Broadcom HAL"""
-        try:
-            # Detect available hardware interfaces
-            self.capabilities.gpio_available = self._check_gpio_available()
-            self.capabilities.i2c_available = self._check_i2c_available()
-            self.capabilities.spi_available = self._check_spi_available()
-            self.capabilities.pwm_available = self._check_pwm_available()
-            self.capabilities.uart_available = self._check_uart_available()
-            self.capabilities.bluetooth_available = self._check_bluetooth_available()
-            self.capabilities.wifi_available = self._check_wifi_available()
-            self.capabilities.display_available = self._check_display_available()
-            self.capabilities.audio_available = self._check_audio_available()
-
-            return Result.success(True)
-        except Exception as e:
-            return Result.failure(
-                SystemError(
-                    ErrorCode.DEVICE_INFO_UNAVAILABLE,
-                    f"Failed to initialize Broadcom HAL: {e}",
-                    ErrorSeverity.HIGH,
-                )
-            )
-
-    def get_capabilities(self) -> HardwareCapabilities:
-        """Get hardware capabilities"""
-        return self.capabilities
+    PLATFORM_NAME = "Broadcom"
 
-    def get_gpio_mapping(self) -> Dict[str, int]:
+    def get_gpio_mapping(self) -> Mapping[str, int]:
         """Get GPIO pin mapping for Raspberry Pi"""
-        if self.soc_spec.gpio_mapping:
-            return self.soc_spec.gpio_mapping
+        gpio_mapping = getattr(self.soc_spec, "gpio_mapping", None)
+        if gpio_mapping:
+            return gpio_mapping
 
         # Default Raspberry Pi GPIO mapping
-        return {
-            "status_led_green": 7,
-            "status_led_red": 11,
-            "status_led_blue": 13,
-            "reset_button": 15,
-            "config_button": 16,
-            "i2c_sda": 3,
-            "i2c_scl": 5,
-            "spi_mosi": 19,
-            "spi_miso": 21,
-            "spi_sclk": 23,
-            "spi_ce0": 24,
-            "pwm0": 12,
-            "pwm1": 33,
-        }
+        return _DEFAULT_GPIO_MAPPING
 
     def get_i2c_buses(self) -> List[int]:
         """Get available I2C buses for Raspberry Pi"""
@@ -331,15 +290,6 @@ class BroadcomHAL(IHardwareAbstractionLayer):
         """Get network interfaces for Raspberry Pi"""
         return ["wlan0", "eth0"]
 
-    def get_display_info(self) -> Dict[str, Any]:
-        """Get display configuration for Raspberry Pi"""
-        return {
-            "hdmi_device": "/dev/dri/card0",
-            "max_resolution": self.soc_spec.connectivity.max_resolution,
-            "hdmi_version": self.soc_spec.connectivity.hdmi_version,
-            "display_outputs": self.soc_spec.connectivity.display_outputs,
-        }
-
     def optimize_performance(self) -> Result[bool, Exception]:
         """Apply Raspberry Pi specific optimizations"""
         try:
@@ -368,113 +318,38 @@ class BroadcomHAL(IHardwareAbstractionLayer):
         """Get thermal zones for Raspberry Pi"""
         return ["/sys/class/thermal/thermal_zone0/temp"]  # CPU temp
 
-    def _check_gpio_available(self) -> bool:
-        """Check if GPIO is available"""
-        import os
-
-        return os.path.exists("/sys/class/gpio")
-
     def _check_i2c_available(self) -> bool:
         """Check if I2C is available"""
-        import os
-
         return os.path.exists("/dev/i2c-1")
 
     def _check_spi_available(self) -> bool:
         """Check if SPI is available"""
-        import os
-
         return os.path.exists("/dev/spidev0.0")
 
-    def _check_pwm_available(self) -> bool:
-        """Check if PWM is available"""
-        import os
-
-        return os.path.exists("/sys/class/pwm")
-
     def _check_uart_available(self) -> bool:
         """Check if UART is available"""
-        import os
-
         return os.path.exists("/dev/ttyAMA0")
 
-    def _check_bluetooth_available(self) -> bool:
-        """Check if Bluetooth is available"""
-        import os
-
-        return os.path.exists("/sys/class/bluetooth")
-
     def _check_wifi_available(self) -> bool:
         """Check if WiFi is available"""
-        import os
-
         return os.path.exists("/sys/class/net/wlan0/wireless")
 
-    def _check_display_available(self) -> bool:
-        """Check if display is available"""
-        import os
-
-        return os.path.exists("/dev/dri/card0")
-
     def _check_audio_available(self) -> bool:
         """Check if audio is available"""
-        import os
-
         return os.path.exists("/dev/snd")
 
 
-class GenericHAL(IHardwareAbstractionLayer):
+class GenericHAL(_ProbingHAL):
     """Generic hardware abstraction layer for unknown SOCs"""
 
-    def __init__(self, soc_spec: Optional[SOCSpecification] = None):
-        self.soc_spec = soc_spec
-        self.capabilities = HardwareCapabilities()
+    INIT_FAILURE_SEVERITY = ErrorSeverity.MEDIUM
 
-    def initialize(self) -> Result[bool, Exception]:
-        """Initialize generic HAL"""
-        try:
-            # Basic capability detection
-            self.capabilities.gpio_available = self._check_gpio_available()
-            self.capabilities.i2c_available = self._check_i2c_available()
-            self.capabilities.spi_available = self._check_spi_available()
-            self.capabilities.pwm_available = self._check_pwm_available()
-            self.capabilities.uart_available = self._check_uart_available()
-            self.capabilities.bluetooth_available = self._check_bluetooth_available()
-            self.capabilities.wifi_available = self._check_wifi_available()
-            self.capabilities.display_available = self._check_display_available()
-            self.capabilities.audio_available = self._check_audio_available()
-
-            return Result.success(True)
-        except Exception as e:
-            return Result.failure(
-                SystemError(
-                    ErrorCode.DEVICE_INFO_UNAVAILABLE,
-                    f"Failed to initialize generic HAL: {e}",
-                    ErrorSeverity.MEDIUM,
-                )
-            )
-
-    def get_capabilities(self) -> HardwareCapabilities:
-        """Get hardware capabilities"""
-        return self.capabilities
+    def __init__(self, soc_spec: Optional[SOCSpecification] = None):
+        super().__init__(soc_spec)
 
-    def get_gpio_mapping(self) -> Dict[str, int]:
+    def get_gpio_mapping(self) -> Mapping[str, int]:
         """Get generic GPIO mapping"""
-        return {
-            "status_led_green": 7,
-            "status_led_red": 11,
-            "status_led_blue": 13,
-            "reset_button": 15,
-            "config_button": 16,
-            "i2c_sda": 3,
-            "i2c_scl": 5,
-            "spi_mosi": 19,
-            "spi_miso": 21,
-            "spi_sclk": 23,
-            "spi_ce0": 24,
-            "pwm0": 12,
-            "pwm1": 33,
-        }
+        return _DEFAULT_GPIO_MAPPING
 
     def get_i2c_buses(self) -> List[int]:
         """Get available I2C buses"""
@@ -509,52 +384,22 @@ class GenericHAL(IHardwareAbstractionLayer):
         """Get thermal zones"""
         return ["/sys/class/thermal/thermal_zone0/temp"]
 
-    def _check_gpio_available(self) -> bool:
-        import os
-
-        return os.path.exists("/sys/class/gpio")
-
     def _check_i2c_available(self) -> bool:
-        import os
-
         return any(os.path.exists(f"/dev/i2c-{i}") for i in range(5))
 
     def _check_spi_available(self) -> bool:
-        import os
-
         return any(os.path.exists(f"/dev/spidev{i}.0") for i in range(5))
 
-    def _check_pwm_available(self) -> bool:
-        import os
-
-        return os.path.exists("/sys/class/pwm")
-
     def _check_uart_available(self) -> bool:
-        import os
-
         return any(os.path.exists(f"/dev/ttyS{i}") for i in range(5))
 
-    def _check_bluetooth_available(self) -> bool:
-        import os
-
-        return os.path.exists("/sys/class/bluetooth")
-
     def _check_wifi_available(self) -> bool:
-        import os
-
         return any(
             os.path.exists(f"/sys/class/net/{iface}/wireless")
             for iface in ["wlan0", "wlp3s0", "wlo1"]
         )
 
-    def _check_display_available(self) -> bool:
-        import os
-
-        return os.path.exists("/dev/dri/card0")
-
     def _check_audio_available(self) -> bool:
-        import os
-
         return os.path.exists("/dev/snd")
 
 
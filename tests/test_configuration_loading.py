@@ -0,0 +1,140 @@
+"""Tests for configuration file loading, caching and loader dispatch."""
+
+import asyncio
+import dataclasses
+import json
+import os
+
+import pytest
+
+from src.domain import configuration_factory
+from src.domain.configuration import (
+    ProvisioningConfig,
+    get_default_config,
+    invalidate_config_path_cache,
+    load_config,
+    save_config,
+)
+from src.domain.configuration_factory import ConfigurationFactory
+from src.domain.configuration_loaders import (
+    ConfigurationLoaderRegistry,
+    JsonConfigurationLoader,
+    YamlConfigurationLoader,
+)
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a minimal JSON config file and return its path."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"ble": {"device_name": "TestDevice"}}))
+    return str(path)
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    """Factory with SOC detection disabled so tests don't touch hardware."""
+    monkeypatch.setattr(configuration_factory, "_detect_soc", lambda: None)
+    return ConfigurationFactory()
+
+
+class TestLoadConfig:
+    """Test module-level load_config."""
+
+    def test_config_saved_after_failed_search_is_found(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        invalidate_config_path_cache()
+        assert load_config() is get_default_config()
+
+        saved = dataclasses.replace(
+            get_default_config(),
+            network=dataclasses.replace(get_default_config().network, retry_attempts=7),
+        )
+        assert save_config(saved, "config.json")
+        try:
+            assert load_config().network.retry_attempts == 7
+        finally:
+            invalidate_config_path_cache()
+
+    def test_factory_does_not_cache_missing_config(
+        self, factory, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        assert factory._find_config_file() is None
+
+        (tmp_path / "config.json").write_text("{}")
+        assert factory._find_config_file() == "config.json"
+
+    def test_missing_file_returns_shared_default(self, tmp_path):
+        config = load_config(str(tmp_path / "missing.json"))
+        assert config is get_default_config()
+
+    def test_file_keys_are_renamed(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "ble": {"advertising_name": "Renamed", "advertising_timeout": 5000},
+                    "security": {"encryption_enabled": False},
+                }
+            )
+        )
+        config = load_config(str(path))
+        assert config.ble.device_name == "Renamed"
+        assert config.ble.advertising_interval == 1000
+
+    def test_config_is_immutable(self):
+        config = get_default_config()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.ble.device_name = "changed"
+
+    def test_to_dict_round_trip(self):
+        config = ProvisioningConfig()
+        assert ProvisioningConfig.from_dict(config.to_dict()) == config
+
+
+class TestConfigurationFactoryLoading:
+    """Test ConfigurationFactory file loading and caching."""
+
+    def test_repeated_loads_are_cached(self, factory, config_file):
+        first = factory.load_config(config_file)
+        assert first.ble.device_name == "TestDevice"
+        assert factory.load_config(config_file) is first
+
+    def test_cache_invalidated_on_mtime_change(self, factory, config_file):
+        first = factory.load_config(config_file)
+        with open(config_file, "w") as f:
+            json.dump({"ble": {"device_name": "Updated"}}, f)
+        stat = os.stat(config_file)
+        os.utime(config_file, (stat.st_atime, stat.st_mtime + 10))
+
+        second = factory.load_config(config_file)
+        assert second is not first
+        assert second.ble.device_name == "Updated"
+
+    def test_load_config_async_matches_sync(self, factory, config_file):
+        config = asyncio.run(factory.load_config_async(config_file))
+        assert config.ble.device_name == "TestDevice"
+        assert factory.load_config(config_file) is config
+
+    def test_invalid_types_are_rejected(self, factory, tmp_path):
+        pytest.importorskip("jsonschema")
+        path = tmp_path / "bad.json"
+        path.write_text(json.dumps({"ble": {"advertising_interval": "fast"}}))
+        result = factory.create_from_file(str(path))
+        assert result.is_failure()
+
+
+class TestConfigurationLoaderRegistry:
+    """Test loader dispatch by file extension."""
+
+    def test_dispatch_by_extension(self):
+        registry = ConfigurationLoaderRegistry()
+        json_loader = JsonConfigurationLoader()
+        yaml_loader = YamlConfigurationLoader()
+        registry.register_loader(json_loader)
+        registry.register_loader(yaml_loader)
+
+        assert registry.get_loader("config/unified_config.json") is json_loader
+        assert registry.get_loader("config.YML") is yaml_loader
+        assert registry.get_loader("config.toml") is None
@@ -0,0 +1,158 @@
+"""Tests for configuration file validation and integrity hashing."""
+
+import copy
+import json
+from types import MappingProxyType
+
+import pytest
+
+from src.domain import configuration_validator
+from src.domain.configuration_validator import ConfigurationValidator, freeze_config
+from src.domain.errors import ErrorCode, ErrorSeverity
+
+VALID_CONFIG = {
+    "version": "1.0",
+    "security": {
+        "config_validation": {"enabled": True},
+        "encryption": {"key_derivation_iterations": 100000},
+        "authentication": {"max_failed_attempts": 3},
+        "network_security": {"min_tls_version": "1.2", "validate_certificates": True},
+    },
+    "hardware": {},
+    "timeouts": {
+        "network_scan_timeout": 10,
+        "connection_timeout": 30,
+        "health_check_timeout": 5,
+    },
+    "ble": {"security_level": "high", "pairing_required": True},
+    "display": {},
+    "network": {"peers": [{"auth_token": "${CONFIG_TEST_TOKEN}"}]},
+}
+
+
+@pytest.fixture
+def validator():
+    return ConfigurationValidator()
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    """Write a config dict to an owner-only JSON file and return its path."""
+
+    def _write(data):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(data))
+        path.chmod(0o600)
+        return str(path)
+
+    return _write
+
+
+class TestValidateConfigFile:
+    """Test ConfigurationValidator.validate_config_file."""
+
+    def test_valid_config(self, validator, write_config, monkeypatch):
+        monkeypatch.setenv("CONFIG_TEST_TOKEN", "value")
+        result = validator.validate_config_file(write_config(VALID_CONFIG))
+        assert result.is_success()
+        assert result.value == VALID_CONFIG
+
+    def test_missing_file(self, validator, tmp_path):
+        result = validator.validate_config_file(str(tmp_path / "missing.json"))
+        assert result.error.code is ErrorCode.CONFIG_FILE_NOT_FOUND
+
+    def test_invalid_json(self, validator, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text("{not json")
+        path.chmod(0o600)
+        result = validator.validate_config_file(str(path))
+        assert result.error.code is ErrorCode.CONFIG_PARSE_ERROR
+
+    def test_issues_are_aggregated(self, validator, write_config, monkeypatch):
+        monkeypatch.delenv("CONFIG_TEST_TOKEN", raising=False)
+        config = copy.deepcopy(VALID_CONFIG)
+        config["version"] = "1"
+        config["ble"]["password"] = "hunter2"
+
+        result = validator.validate_config_file(write_config(config))
+
+        error = result.error
+        assert error.code is ErrorCode.CONFIG_VALIDATION_ERROR
+        assert error.severity is ErrorSeverity.CRITICAL
+        assert "Invalid version format: 1" in error.message
+        assert "plaintext credential at ble.password" in error.message
+        assert (
+            "CONFIG_TEST_TOKEN (referenced at network.peers[0].auth_token)"
+            in error.message
+        )
+
+    def test_outdated_tls_version_is_rejected(
+        self, validator, write_config, monkeypatch
+    ):
+        monkeypatch.setenv("CONFIG_TEST_TOKEN", "value")
+        config = copy.deepcopy(VALID_CONFIG)
+        config["security"]["network_security"]["min_tls_version"] = "1.1"
+
+        result = validator.validate_config_file(write_config(config))
+        assert "Minimum TLS version too low: 1.1" in result.error.message
+
+
+class TestConfigIntegrity:
+    """Test config hashing and integrity verification."""
+
+    def test_hash_is_key_order_independent(self, validator):
+        reordered = dict(reversed(list(VALID_CONFIG.items())))
+        assert validator.generate_config_hash(
+            reordered
+        ) == validator.generate_config_hash(VALID_CONFIG)
+
+    def test_verify_config_integrity(self, validator):
+        expected = validator.generate_config_hash(VALID_CONFIG)
+        assert validator.verify_config_integrity(VALID_CONFIG, expected)
+
+        assert validator.verify_config_integrity(VALID_CONFIG, bytes.fromhex(expected))
+        assert not validator.verify_config_integrity(VALID_CONFIG, "not-hex")
+
+        changed = copy.deepcopy(VALID_CONFIG)
+        changed["version"] = "2.0"
+        assert not validator.verify_config_integrity(changed, expected)
+
+    def test_frozen_config_hash_matches_and_is_cached(self, validator):
+        frozen = freeze_config(VALID_CONFIG)
+        expected = validator.generate_config_hash(VALID_CONFIG)
+
+        assert validator.generate_config_hash(frozen) == expected
+        assert validator._hash_cache[id(frozen)] == (frozen, bytes.fromhex(expected))
+        assert validator.verify_config_integrity(frozen, expected)
+
+        with pytest.raises(TypeError):
+            frozen["version"] = "2.0"
+
+    def test_proxy_over_live_dict_is_not_cached(self, validator):
+        backing = copy.deepcopy(VALID_CONFIG)
+        proxy = MappingProxyType(backing)
+        expected = validator.generate_config_hash(proxy)
+        assert id(proxy) not in validator._hash_cache
+
+        backing["version"] = "2.0"
+        assert not validator.verify_config_integrity(proxy, expected)
+
+    def test_canonical_json_is_stdlib_encoding(self):
+        config = {"ratio": 1e-7, "limit": 1e16, "big": 2**70, "name": "café"}
+        assert configuration_validator._canonical_json(config) == (
+            '{"big":1180591620717411303424,"limit":1e+16,"name":"café","ratio":1e-07}'
+        ).encode("utf-8")
+
+    def test_hash_from_other_algorithm_verifies(self, validator, monkeypatch):
+        monkeypatch.setattr(
+            configuration_validator, "_cpu_has_sha_extensions", lambda: True
+        )
+        sha256_hash = validator.generate_config_hash(VALID_CONFIG)
+        monkeypatch.setattr(
+            configuration_validator, "_cpu_has_sha_extensions", lambda: False
+        )
+        blake2b_hash = validator.generate_config_hash(VALID_CONFIG)
+
+        assert sha256_hash != blake2b_hash
+        assert validator.verify_config_integrity(VALID_CONFIG, sha256_hash)
+        assert validator.verify_config_integrity(VALID_CONFIG, blake2b_hash)
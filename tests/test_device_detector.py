@@ -0,0 +1,106 @@
+"""Tests for device hardware detection."""
+
+from src.infrastructure.device import detector
+from src.infrastructure.device.detector import (
+    DeviceDetector,
+    invalidate_device_info_cache,
+)
+
+
+class TestIdentityFileCache:
+    """Test the shared identity file cache."""
+
+    def test_file_is_read_once_until_invalidated(self, tmp_path):
+        path = tmp_path / "board_name"
+        path.write_text("ROCK Pi 4B\n")
+        invalidate_device_info_cache()
+
+        assert detector._read_identity_file(str(path)) == "ROCK Pi 4B\n"
+        path.write_text("changed\n")
+        assert detector._read_identity_file(str(path)) == "ROCK Pi 4B\n"
+
+        invalidate_device_info_cache()
+        assert detector._read_identity_file(str(path)) == "changed\n"
+
+    def test_missing_file_reads_as_none(self, tmp_path):
+        assert detector._read_identity_file(str(tmp_path / "missing")) is None
+
+    def test_detectors_share_reads(self, monkeypatch):
+        files = {"/sys/class/dmi/id/board_name": "4B\n"}
+        reads = []
+
+        def fake_read(path):
+            reads.append(path)
+            if path not in files:
+                raise FileNotFoundError(path)
+            return files[path]
+
+        monkeypatch.setattr(detector, "read_small_file", fake_read)
+        monkeypatch.setattr(detector, "soc_manager", None)
+        invalidate_device_info_cache()
+        try:
+            for _ in range(3):
+                result = DeviceDetector()._get_rockpi_hardware_version()
+                assert result.value == "ROCK Pi 4B"
+        finally:
+            invalidate_device_info_cache()
+
+        assert reads == ["/proc/device-tree/compatible", "/sys/class/dmi/id/board_name"]
+
+    def test_multi_chunk_file_is_read_whole(self, tmp_path):
+        path = tmp_path / "cpuinfo"
+        content = "processor\t: 0\n" * 1000
+        path.write_text(content)
+        assert detector.read_small_file(str(path)) == content
+
+
+class TestHardwareVersion:
+    """Test board-specific hardware version probes."""
+
+    def test_rockpi_reuses_soc_manager_compatible(self, monkeypatch):
+        class FakeManager:
+            def get_hardware_info(self):
+                return {
+                    "model": "",
+                    "compatible": ("radxa,rockpi4b", "rockchip,rk3399"),
+                }
+
+        monkeypatch.setattr(detector, "soc_manager", FakeManager())
+        monkeypatch.setattr(detector, "_read_identity_file", lambda path: None)
+        result = DeviceDetector()._get_rockpi_hardware_version()
+        assert result.value == "ROCK Pi 4B+"
+
+    def test_raspberry_pi_revision_from_cpuinfo(self, monkeypatch):
+        cpuinfo = (
+            "processor\t: 0\nBogoMIPS\t: 108.00\n\n"
+            "Hardware\t: BCM2835\nRevision\t: c03111\n"
+        )
+        monkeypatch.setattr(
+            detector,
+            "_read_identity_file",
+            lambda path: cpuinfo if path == "/proc/cpuinfo" else None,
+        )
+        result = DeviceDetector()._get_raspberry_pi_hardware_version()
+        assert result.value == "Raspberry Pi (Rev: c03111)"
+
+
+class TestSOCSpecCache:
+    """Test caching of the detected SOC specification."""
+
+    def test_unknown_soc_is_detected_once(self, monkeypatch):
+        calls = []
+
+        class FakeManager:
+            def detect_soc(self):
+                calls.append(1)
+                return None
+
+        monkeypatch.setattr(detector, "soc_manager", FakeManager())
+        device = DeviceDetector()
+        assert device.get_soc_spec() is None
+        assert device.get_soc_spec() is None
+        assert calls == [1]
+
+        device.invalidate_cache()
+        device.get_soc_spec()
+        assert calls == [1, 1]
@@ -0,0 +1,118 @@
+"""Tests for the domain event bus."""
+
+import asyncio
+from datetime import datetime
+
+from src.domain.events import EventBus, EventType, get_event_bus, reset_event_bus
+
+
+class TestEventHistory:
+    """Test event history retention and queries."""
+
+    def test_history_is_bounded(self):
+        bus = EventBus()
+        for i in range(bus._max_history + 50):
+            bus.publish(EventType.SYSTEM_HEALTH_CHECK, i)
+
+        history = bus.get_event_history(limit=bus._max_history * 2)
+        assert len(history) == bus._max_history
+        assert history[0].data == 50
+        assert history[-1].data == bus._max_history + 49
+
+    def test_filter_by_type_returns_latest(self):
+        bus = EventBus()
+        for i in range(10):
+            event_type = EventType.DISPLAY_ERROR if i % 2 else EventType.SYSTEM_ERROR
+            bus.publish(event_type, i)
+
+        history = bus.get_event_history(EventType.DISPLAY_ERROR, limit=2)
+        assert [event.data for event in history] == [7, 9]
+
+    def test_clear_history(self):
+        bus = EventBus()
+        bus.publish(EventType.SYSTEM_ERROR, None)
+        bus.clear_history()
+        assert bus.get_event_history() == []
+
+    def test_filtered_history_drops_evicted_events(self):
+        bus = EventBus()
+        bus.publish(EventType.DISPLAY_ERROR, "old")
+        for i in range(bus._max_history):
+            bus.publish(EventType.SYSTEM_HEALTH_CHECK, i)
+
+        assert bus.get_event_history(EventType.DISPLAY_ERROR) == []
+
+
+class TestPublish:
+    """Test event delivery to subscribers."""
+
+    def test_sync_handlers_receive_event(self):
+        bus = EventBus()
+        received = []
+
+        def failing_handler(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(EventType.NETWORK_CONNECTION_SUCCESS, failing_handler)
+        bus.subscribe(EventType.NETWORK_CONNECTION_SUCCESS, received.append)
+        bus.publish(
+            EventType.NETWORK_CONNECTION_SUCCESS, {"ssid": "home"}, source="test"
+        )
+
+        assert len(received) == 1
+        assert received[0].data == {"ssid": "home"}
+        assert received[0].source == "test"
+
+    def test_async_handlers_receive_event(self):
+        bus = EventBus()
+        received = []
+
+        async def coroutine_handler(event):
+            received.append(("async", event.data))
+
+        bus.subscribe_async(EventType.SYSTEM_HEALTH_CHECK, coroutine_handler)
+        bus.subscribe_async(
+            EventType.SYSTEM_HEALTH_CHECK,
+            lambda event: received.append(("sync", event.data)),
+        )
+        asyncio.run(bus.publish_async(EventType.SYSTEM_HEALTH_CHECK, 1))
+
+        assert sorted(received) == [("async", 1), ("sync", 1)]
+
+    def test_event_ids_are_unique(self):
+        bus = EventBus()
+        bus.publish(EventType.SYSTEM_ERROR, 1)
+        bus.publish(EventType.SYSTEM_ERROR, 2)
+
+        first, second = bus.get_event_history()
+        assert first.event_id != second.event_id
+
+    def test_timestamps_are_monotonic(self):
+        bus = EventBus()
+        bus.publish(EventType.SYSTEM_ERROR, 1)
+        bus.publish(EventType.SYSTEM_ERROR, 2)
+
+        first, second = bus.get_event_history()
+        assert first.timestamp <= second.timestamp
+        assert abs((datetime.now() - second.wall_time).total_seconds()) < 5
+
+
+class TestGlobalEventBus:
+    """Test the process-wide event bus accessor."""
+
+    def test_get_event_bus_is_singleton_until_reset(self):
+        bus = get_event_bus()
+        assert get_event_bus() is bus
+
+        reset_event_bus()
+        assert get_event_bus() is not bus
+
+    def test_event_ids_stay_unique_across_reset(self):
+        reset_event_bus()
+        get_event_bus().publish(EventType.SYSTEM_ERROR, 1)
+        (before,) = get_event_bus().get_event_history()
+
+        reset_event_bus()
+        get_event_bus().publish(EventType.SYSTEM_ERROR, 2)
+        (after,) = get_event_bus().get_event_history()
+        assert after.event_id != before.event_id
@@ -0,0 +1,49 @@
+"""Tests for the hardware abstraction layers."""
+
+import pytest
+
+from src.domain.soc_specifications import SOCManager
+from src.infrastructure.hardware_abstraction import BroadcomHAL, GenericHAL, RockchipHAL
+
+
+@pytest.fixture
+def soc_spec():
+    return SOCManager().detect_soc({"model": "rock-pi-4", "compatible": []})
+
+
+class TestGPIOMapping:
+    """Test default GPIO pin mappings."""
+
+    def test_default_mapping_is_shared_and_read_only(self, soc_spec):
+        mappings = [
+            RockchipHAL(soc_spec).get_gpio_mapping(),
+            BroadcomHAL(soc_spec).get_gpio_mapping(),
+            GenericHAL().get_gpio_mapping(),
+        ]
+        assert all(mapping is mappings[0] for mapping in mappings)
+        assert mappings[0]["reset_button"] == 15
+
+        with pytest.raises(TypeError):
+            mappings[0]["reset_button"] = 1
+
+
+class TestInitialize:
+    """Test HAL capability probing."""
+
+    def test_generic_hal_initializes(self):
+        hal = GenericHAL()
+        assert hal.initialize().is_success()
+        assert hal.get_capabilities() is hal.capabilities
+
+    def test_probe_failure_names_platform(self, soc_spec, monkeypatch):
+        def fail(self):
+            raise OSError("no sysfs")
+
+        monkeypatch.setattr(RockchipHAL, "_check_gpio_available", fail)
+        result = RockchipHAL(soc_spec).initialize()
+        assert result.is_failure()
+        assert "Failed to initialize Rockchip HAL: no sysfs" in result.error.message
+
+    def test_display_info_comes_from_spec(self, soc_spec):
+        info = BroadcomHAL(soc_spec).get_display_info()
+        assert info["max_resolution"] == soc_spec.connectivity.max_resolution
@@ -0,0 +1,17 @@
+"""Tests for QR code text rendering."""
+
+from types import SimpleNamespace
+
+from src.infrastructure.display import qr_generator
+from src.infrastructure.display.qr_generator import QRCodeGenerator
+
+
+class TestTextQRCode:
+    """Test the serial-output text rendering of QR modules."""
+
+    def test_modules_render_as_blocks(self, monkeypatch):
+        monkeypatch.setattr(qr_generator, "QR_AVAILABLE", True)
+        qr = SimpleNamespace(modules=[[True, False], [False, True]])
+
+        text = QRCodeGenerator()._generate_text_qr_code(qr)
+        assert text.split("\n") == ["+----+", "|██  |", "|  ██|", "+----+"]
@@ -0,0 +1,49 @@
+"""Tests for Result error handling."""
+
+import subprocess
+
+from src.common.result_handling import Result
+from src.domain.errors import ErrorCode, ErrorSeverity, ValidationError
+
+
+def raised(exc):
+    """Return exc after raising it, so it carries a traceback"""
+    try:
+        raise exc
+    except Exception as e:
+        return e
+
+
+class TestFailureTracebacks:
+    """Test that stored failures keep their details but not their frames."""
+
+    def test_attributes_outside_args_are_kept(self):
+        missing = raised(FileNotFoundError(2, "No such file", "/x"))
+        error = Result.from_exception(missing).error
+        assert error.filename == "/x"
+        assert error.__traceback__ is None
+
+        called = raised(
+            subprocess.CalledProcessError(1, ["ls"], output="out", stderr="err")
+        )
+        error = Result.from_exception(called).error
+        assert (error.output, error.stderr) == ("out", "err")
+
+    def test_provisioning_error_and_cause_chain_are_detached(self):
+        try:
+            try:
+                raise ValueError("inner")
+            except ValueError as cause:
+                raise ValidationError(
+                    ErrorCode.CONFIG_INVALID_FORMAT, "bad", ErrorSeverity.HIGH
+                ) from cause
+        except ValidationError as e:
+            original = e
+
+        error = Result.from_exception(original).error
+        assert error is not original
+        assert (error.code, error.message) == (original.code, original.message)
+        assert error.__traceback__ is None
+        assert str(error.__cause__) == "inner"
+        assert error.__cause__.__traceback__ is None
+        assert original.__cause__.__traceback__ is not None
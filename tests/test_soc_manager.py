@@ -0,0 +1,211 @@
+"""Tests for SOCManager hardware detection."""
+
+import dataclasses
+
+import pytest
+
+from src.domain import soc_specifications
+from src.domain.soc_specifications import SOCManager
+
+
+class TestSOCManagerDetection:
+    """Test SOC matching against hardware information."""
+
+    def test_detects_by_device_tree_compatible(self):
+        manager = SOCManager()
+        spec = manager.detect_soc(
+            {"model": "unknown", "compatible": ["radxa,rockpi4", "rockchip,rk3399"]}
+        )
+        assert spec.name == "Rock Pi 4 (RK3399)"
+
+    def test_detects_by_model_pattern(self):
+        manager = SOCManager()
+        spec = manager.detect_soc({"model": "Radxa ROCK-PI-4B-PLUS", "compatible": []})
+        assert spec.name == "Rock Pi 4B+ (OP1)"
+
+    def test_unknown_hardware(self):
+        manager = SOCManager()
+        assert manager.detect_soc({"model": "x86_64", "compatible": []}) is None
+
+    @pytest.mark.parametrize("compatible", [None, 42, [None]])
+    def test_malformed_compatible_does_not_raise(self, compatible):
+        manager = SOCManager()
+        assert manager.detect_soc({"model": "x86_64", "compatible": compatible}) is None
+
+    def test_missing_compatible_still_matches_model(self):
+        manager = SOCManager()
+        spec = manager.detect_soc({"model": "rock-pi-4", "compatible": None})
+        assert spec.name == "Rock Pi 4 (RK3399)"
+
+    def test_hardware_info_is_read_once(self):
+        soc_specifications._read_hardware_info.cache_clear()
+        manager = SOCManager()
+
+        first = manager._get_hardware_info()
+        assert manager._get_hardware_info() is first
+        assert soc_specifications._read_hardware_info.cache_info().misses == 1
+
+    def test_detection_is_cached_until_invalidated(self):
+        manager = SOCManager()
+        hardware = {"model": "Rock Pi 4", "compatible": ["rockchip,rk3399"]}
+        spec = manager.detect_soc(hardware)
+
+        manager._specifications.clear()
+        assert manager.detect_soc(dict(hardware)) is spec
+
+        manager.invalidate()
+        assert manager.detect_soc(hardware) is None
+
+    def test_device_tree_nodes_are_parsed(self, tmp_path, monkeypatch):
+        (tmp_path / "compatible").write_bytes(b"radxa,rockpi4b\x00rockchip,rk3399\x00")
+        (tmp_path / "model").write_bytes(b"Radxa ROCK Pi 4B\x00")
+        monkeypatch.setattr(soc_specifications, "_DEVICE_TREE_ROOT", f"{tmp_path}/")
+        soc_specifications._read_hardware_info.cache_clear()
+        try:
+            info = soc_specifications._read_hardware_info()
+        finally:
+            soc_specifications._read_hardware_info.cache_clear()
+
+        assert info["compatible"] == ("radxa,rockpi4b", "rockchip,rk3399")
+        assert info["model"] == "Radxa ROCK Pi 4B"
+
+    def test_model_is_read_without_compatible_node(self, tmp_path, monkeypatch):
+        (tmp_path / "model").write_bytes(b"Radxa ROCK Pi 4B\x00")
+        monkeypatch.setattr(soc_specifications, "_DEVICE_TREE_ROOT", f"{tmp_path}/")
+        soc_specifications._read_hardware_info.cache_clear()
+        try:
+            info = soc_specifications._read_hardware_info()
+        finally:
+            soc_specifications._read_hardware_info.cache_clear()
+
+        assert info["compatible"] == ()
+        assert info["model"] == "Radxa ROCK Pi 4B"
+
+    def test_earliest_registered_spec_wins_on_overlap(self):
+        manager = SOCManager()
+        # "rock-pi-4" (second spec) also occurs inside "rock-pi-4b-plus" (first spec)
+        spec = manager.detect_soc({"model": "radxa rock-pi-4b-plus", "compatible": []})
+        assert spec is manager._specifications[0]
+
+        spec = manager.detect_soc(
+            {"model": "unknown", "compatible": ["rockchip,rock-pi-4b"]}
+        )
+        assert spec is manager._specifications[1]
+
+    def test_matchers_are_shared_between_managers(self):
+        first, second = SOCManager(), SOCManager()
+        first.detect_soc({"model": "rock-pi-4", "compatible": []})
+        second.detect_soc({"model": "x86_64", "compatible": []})
+
+        assert first._matchers is not None
+        assert all(a is b for a, b in zip(first._matchers, second._matchers))
+
+    def test_specs_without_patterns_keep_group_mapping(self):
+        manager = SOCManager()
+        compat_only = dataclasses.replace(
+            manager._specifications[0],
+            name="Compatible only",
+            detection_patterns=[],
+            device_tree_compatible=["vendor,board"],
+        )
+        manager._specifications.insert(0, compat_only)
+        manager.invalidate()
+
+        spec = manager.detect_soc({"model": "rock-pi-4", "compatible": []})
+        assert spec.name == "Rock Pi 4 (RK3399)"
+        assert (
+            manager.detect_soc({"model": "", "compatible": ["vendor,board"]})
+            is compat_only
+        )
+
+    def test_default_specs_are_built_lazily_and_shared(self):
+        manager = SOCManager()
+        assert manager._specs is None
+
+        spec = manager.detect_soc({"model": "rock-pi-4", "compatible": []})
+        assert spec is SOCManager().detect_soc({"model": "rock-pi-4", "compatible": []})
+        assert spec.performance.cpu_big_max_freq_mhz == 1800
+
+    def test_model_match_can_beat_compatible_match(self):
+        manager = SOCManager()
+        spec = manager.detect_soc(
+            {"model": "rock-pi-4b-plus", "compatible": ["rockchip,rk3399"]}
+        )
+        assert spec is manager._specifications[0]
+
+    def test_default_spec_table_is_read_only(self):
+        data = soc_specifications._DEFAULT_SPEC_DATA[0]
+        with pytest.raises(TypeError):
+            data["performance"]["cpu_cores"] = 1
+        assert isinstance(data["detection_patterns"], tuple)
+
+        spec = soc_specifications._build_specification(data)
+        assert spec.power_management.power_states == ["active", "idle", "suspend"]
+
+    def test_missing_sections_share_empty_profiles(self):
+        data = {
+            key: value
+            for key, value in soc_specifications._DEFAULT_SPEC_DATA[0].items()
+            if key not in ("io_capabilities", "power_management")
+        }
+        first = soc_specifications._build_specification(data)
+        second = soc_specifications._build_specification(data)
+
+        assert first.io_capabilities is second.io_capabilities
+        assert first.power_management is soc_specifications._EMPTY_POWER_PROFILE
+        assert first.io_capabilities.gpio_pins == 0
+
+    def test_sentinel_prefilter_rejects_other_boards(self):
+        manager = SOCManager()
+        hardware = {
+            "model": "raspberry pi 4 model b rev 1.4",
+            "compatible": ["raspberrypi,4-model-b", "brcm,bcm2711"],
+        }
+        assert manager.detect_soc(hardware) is None
+
+        model_matcher, compatible_matcher = manager._matchers
+        assert model_matcher[2].search("raspberry pi 4 model b rev 1.4") is None
+        assert compatible_matcher[2].pattern == "roc"
+
+
+class TestSOCManagerLookup:
+    """Test lookups over the registered specifications."""
+
+    def test_all_supported_socs(self):
+        manager = SOCManager()
+        socs = manager.get_all_supported_socs()
+        assert [spec.name for spec in socs] == [
+            "Rock Pi 4B+ (OP1)",
+            "Rock Pi 4 (RK3399)",
+        ]
+
+        socs.clear()
+        assert len(manager.get_all_supported_socs()) == 2
+
+    def test_get_soc_by_name(self):
+        manager = SOCManager()
+        assert (
+            manager.get_soc_by_name("rock pi 4 (rk3399)") is manager._specifications[1]
+        )
+        assert manager.get_soc_by_name("Unknown SOC") is None
+
+    def test_registered_spec_is_found_by_name(self):
+        manager = SOCManager()
+        custom = dataclasses.replace(manager._specifications[0], name="Custom Board")
+        manager.register_specification(custom)
+
+        assert manager.get_soc_by_name("CUSTOM BOARD") is custom
+        assert manager.get_all_supported_socs()[-1] is custom
+
+    def test_get_soc_by_alias(self):
+        manager = SOCManager()
+        assert manager.get_soc_by_name("OP1") is manager._specifications[0]
+        assert manager.get_soc_by_name("rk3399") is manager._specifications[1]
+
+    def test_name_index_is_rebuilt_after_invalidate(self):
+        manager = SOCManager()
+        assert manager.get_soc_by_name("op1") is not None
+
+        manager._specifications.clear()
+        manager.invalidate()
+        assert manager.get_soc_by_name("op1") is None
@@ -0,0 +1,118 @@
+"""Tests for the SOC family registry."""
+
+from types import MappingProxyType
+
+import pytest
+
+from src.domain.soc.base_types import SOCFamily
+from src.domain.soc_registry import SOCRegistry, SOCRegistryEntry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isolate registry class state so custom registrations don't leak"""
+    use_families(monkeypatch, dict(SOCRegistry._families))
+    return SOCRegistry
+
+
+def use_families(monkeypatch, families):
+    """Point the registry at the given family table with empty caches"""
+    monkeypatch.setattr(SOCRegistry, "_families", families)
+    monkeypatch.setattr(SOCRegistry, "REGISTERED_FAMILIES", MappingProxyType(families))
+    monkeypatch.setattr(SOCRegistry, "_families_tuple", None)
+    monkeypatch.setattr(SOCRegistry, "_board_index", None)
+    monkeypatch.setattr(SOCRegistry, "_detector_cache", None)
+
+
+class FakeDetector:
+    """Stand-in detector class"""
+
+
+class TestSOCRegistry:
+    """Test family registration and lookups."""
+
+    def test_detector_class_is_resolved_lazily_once(self, registry):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return FakeDetector
+
+        registry.register_family(
+            SOCRegistryEntry.lazy(
+                family=SOCFamily.UNKNOWN,
+                detector_factory=factory,
+                description="Test",
+                manufacturer="Test",
+                common_boards=["Test Board"],
+            )
+        )
+        assert calls == []
+
+        assert registry.get_detector_class(SOCFamily.UNKNOWN) is FakeDetector
+        assert registry.get_detector_class(SOCFamily.UNKNOWN) is FakeDetector
+        assert calls == [1]
+
+    def test_entry_accepts_detector_class(self):
+        entry = SOCRegistryEntry(
+            family=SOCFamily.UNKNOWN,
+            detector_class=FakeDetector,
+            description="Test",
+            manufacturer="Test",
+            common_boards=[],
+        )
+        assert entry.detector_class is FakeDetector
+
+    def test_detectors_are_created_once(self, registry, monkeypatch):
+        use_families(monkeypatch, {})
+        registry.register_family(
+            SOCRegistryEntry(
+                family=SOCFamily.UNKNOWN,
+                detector_class=FakeDetector,
+                description="Test",
+                manufacturer="Test",
+                common_boards=[],
+            )
+        )
+
+        (detector,) = registry.create_all_detectors()
+        assert isinstance(detector, FakeDetector)
+        assert registry.create_all_detectors()[0] is detector
+
+    def test_families_are_read_only_and_cached(self, registry):
+        families = registry.get_all_families()
+        assert registry.get_all_families() is families
+        assert SOCFamily.ROCKCHIP in families
+
+        with pytest.raises(TypeError):
+            registry.REGISTERED_FAMILIES[SOCFamily.UNKNOWN] = None
+
+        registry.register_family(
+            SOCRegistryEntry(
+                family=SOCFamily.UNKNOWN,
+                detector_class=FakeDetector,
+                description="Test",
+                manufacturer="Test",
+                common_boards=[],
+            )
+        )
+        assert SOCFamily.UNKNOWN in registry.get_all_families()
+
+    def test_find_family_by_board(self, registry):
+        assert registry.find_family_by_board("Raspberry Pi 4") is SOCFamily.BROADCOM
+        assert registry.find_family_by_board("rock pi 4b+") is SOCFamily.ROCKCHIP
+        assert registry.find_family_by_board("Unknown Board") is SOCFamily.UNKNOWN
+
+    def test_registering_family_updates_board_lookup(self, registry):
+        assert registry.find_family_by_board("Custom Board X") is SOCFamily.UNKNOWN
+
+        registry.register_family(
+            SOCRegistryEntry(
+                family=SOCFamily.QUALCOMM,
+                detector_class=FakeDetector,
+                description="Test",
+                manufacturer="Test",
+                common_boards=["Custom Board X"],
+            )
+        )
+        assert registry.find_family_by_board("custom board x") is SOCFamily.QUALCOMM
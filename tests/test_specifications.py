@@ -0,0 +1,108 @@
+"""Tests for validation specifications."""
+
+import pytest
+
+from src.domain.specifications import (
+    DevicePinSpecification,
+    SpecificationBasedValidationService,
+    StrongPasswordSpecification,
+    ValidSSIDSpecification,
+    ValidIPAddressSpecification,
+    ValidMacAddressSpecification,
+)
+
+
+class TestNetworkAddressSpecifications:
+    """Test IP and MAC address specifications."""
+
+    @pytest.mark.parametrize(
+        "ip, expected",
+        [
+            ("192.168.1.1", True),
+            ("255.255.255.255", True),
+            ("256.1.1.1", False),
+            ("1.2.3", False),
+            ("1.2.3.4.5", False),
+            ("1..3.4", False),
+            ("1.2.3.0004", False),
+            ("1.2.3.4\n", False),
+            (" 1.2.3.4", False),
+            ("", False),
+        ],
+    )
+    def test_ip_address(self, ip, expected):
+        assert ValidIPAddressSpecification().is_satisfied_by(ip) is expected
+
+    @pytest.mark.parametrize(
+        "mac, expected",
+        [
+            ("aa:bb:cc:dd:ee:ff", True),
+            ("AA-BB-CC-DD-EE-FF", True),
+            ("aa:bb:cc:dd:ee", False),
+            ("", False),
+        ],
+    )
+    def test_mac_address(self, mac, expected):
+        assert ValidMacAddressSpecification().is_satisfied_by(mac) is expected
+
+
+class TestCredentialSpecifications:
+    """Test SSID, password and PIN specifications."""
+
+    @pytest.mark.parametrize(
+        "ssid, expected",
+        [
+            ("Office WiFi", True),
+            ("~!@#$%^&*()", True),
+            ("café", False),
+            ("tab\there", False),
+            ("del\x7f", False),
+            ("x" * 33, False),
+            ("   ", False),
+        ],
+    )
+    def test_ssid(self, ssid, expected):
+        assert ValidSSIDSpecification().is_satisfied_by(ssid) is expected
+
+    @pytest.mark.parametrize(
+        "password, expected",
+        [
+            ("Password123", False),
+            ("12345678", False),
+            ("correct-horse", True),
+            ("short", False),
+        ],
+    )
+    def test_password(self, password, expected):
+        assert StrongPasswordSpecification().is_satisfied_by(password) is expected
+
+    @pytest.mark.parametrize(
+        "pin, expected",
+        [
+            ("1234", False),
+            ("0123", False),
+            ("1111", False),
+            ("2580", True),
+            ("12a4", False),
+        ],
+    )
+    def test_pin(self, pin, expected):
+        assert DevicePinSpecification().is_satisfied_by(pin) is expected
+
+
+class TestSpecificationBasedValidationService:
+    """Test the specification-backed validation service."""
+
+    def test_specs_are_built_once(self, monkeypatch):
+        service = SpecificationBasedValidationService()
+        monkeypatch.setattr(
+            service.factory,
+            "create_ip_address_spec",
+            lambda: pytest.fail("spec rebuilt"),
+        )
+
+        assert service.validate_ip_address("10.0.0.1")
+        assert not service.validate_mac_address("not-a-mac")
+        assert service.validate_network_credentials(
+            {"ssid": "Office", "password": "s3cure-pass"}
+        )
@@ -0,0 +1,50 @@
+"""Tests for async/sync thread coordination."""
+
+import asyncio
+import concurrent.futures
+
+import pytest
+
+from src.common.threading_coordination import ThreadCoordinator
+
+
+class TestRunAsyncFromSync:
+    """Test running coroutines from synchronous code."""
+
+    def test_returns_coroutine_result(self):
+        async def answer():
+            return 42
+
+        assert ThreadCoordinator().run_async_from_sync(answer()) == 42
+
+    def test_hung_coroutine_times_out_and_is_cancelled(self):
+        cancelled = concurrent.futures.Future()
+
+        async def hang():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set_result(True)
+                raise
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            ThreadCoordinator().run_async_from_sync(hang(), timeout=0.1)
+        assert cancelled.result(timeout=1)
+
+    def test_rejects_calls_from_a_running_loop(self):
+        coordinator = ThreadCoordinator()
+
+        async def nested():
+            return 1
+
+        async def caller():
+            coro = nested()
+            try:
+                with pytest.raises(RuntimeError):
+                    coordinator.run_async_from_sync(coro)
+            finally:
+                coro.close()
+
+        # An unregistered loop on this thread, then the background loop's own thread
+        asyncio.run(caller())
+        coordinator.run_async_from_sync(caller())
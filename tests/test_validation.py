@@ -0,0 +1,30 @@
+"""Tests for the domain validation service."""
+
+import pytest
+
+from src.domain.validation import ValidationService
+
+
+@pytest.fixture
+def service():
+    return ValidationService()
+
+
+class TestInjectionPatterns:
+    """Test injection pattern detection."""
+
+    @pytest.mark.parametrize(
+        "text", ["1 UNION SELECT 1", "<SCRIPT>", "JavaScript:alert", "a && b", "\\X1F"]
+    )
+    def test_detects_patterns_case_insensitively(self, service, text):
+        assert service._contains_injection_patterns(text)
+
+    def test_plain_text_is_clean(self, service):
+        assert not service._contains_injection_patterns("Office Network 5G")
+
+    def test_ssid_config_directive_is_rejected(self, service):
+        valid, errors = service.validate_wifi_credentials(
+            "net #CONFIG", "Str0ng!Passw0rd"
+        )
+        assert not valid
+        assert "SSID contains network configuration injection patterns" in errors